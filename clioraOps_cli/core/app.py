@@ -3,41 +3,183 @@ Main application orchestrator for ClioraOps.
 Supports interactive and command execution modes.
 """
 
+import asyncio
+from typing import Optional
+
 from clioraOps_cli.core.modes import Mode
+from clioraOps_cli.core.context import SessionContext
 from clioraOps_cli.core.session import SessionManager
 from clioraOps_cli.core.commands import CommandRouter
+from clioraOps_cli.core.response_cache import ResponseCache, CACHEABLE_COMMANDS
 from clioraOps_cli.config.settings import save_config
 from clioraOps_cli.integrations.ai_provider import create_ai_client
 
 
 class ClioraOpsApp:
-    def __init__(self, mode: Mode):
+    __slots__ = ("mode", "context", "response_cache", "_ai", "_session", "_command_router")
+
+    def __init__(self, mode: Mode, response_cache: Optional[ResponseCache] = None):
         self.mode = mode
 
-        # Initialize Unified AI Provider (Gemini → Ollama → Local fallback)
-        self.ai = create_ai_client(mode=mode)
+        # Shared by the router and the interactive session
+        self.context = SessionContext()
 
-        self.session = SessionManager(mode, self.ai)
-        self.command_router = CommandRouter(
-            mode,
-            self.session.context,
-            self.ai
-        )
+        # AI client, session and router are built on first use
+        self._ai = None
+        self._session = None
+        self._command_router = None
+
+        # Apps in one process share a cache, since each cache locks its own
+        # writes but they all write the same file
+        self.response_cache = response_cache if response_cache is not None else ResponseCache()
+
+    @property
+    def ai(self):
+        """Unified AI Provider (Gemini → Ollama → Local fallback)."""
+        if self._ai is None:
+            self._ai = create_ai_client(mode=self.mode)
+        return self._ai
+
+    @property
+    def session(self) -> SessionManager:
+        if self._session is None:
+            self._session = SessionManager(self.mode, self.ai, context=self.context)
+        return self._session
+
+    @property
+    def command_router(self) -> CommandRouter:
+        if self._command_router is None:
+            self._command_router = CommandRouter(
+                self.mode,
+                self.context,
+                self.ai
+            )
+        return self._command_router
 
 
     def run(self, command: str, *args) -> None:
         """Execute a single command."""
+        if command in CACHEABLE_COMMANDS:
+            print(self._run_cached(command, args))
+            return
+
         self.command_router.route(
             " ".join([command, *args])
         )
 
+    async def stream(self, user_input: str):
+        """
+        Run a command line and yield its output lines as they are produced.
+
+        Cached output for learn/explain/design comes back as a single chunk;
+        a cache miss streams and then stores the full output.
+        """
+        command, _, rest = user_input.strip().partition(" ")
+        args = tuple(rest.split())
+        cacheable = command in CACHEABLE_COMMANDS
+
+        if cacheable:
+            cached = await asyncio.to_thread(self.response_cache.get, self.mode, command, args)
+            if cached is not None:
+                self._replay_context(command, args)
+                yield cached
+                return
+
+        loop = asyncio.get_running_loop()
+        lines = asyncio.Queue()
+        done = object()
+
+        def emit(line):
+            loop.call_soon_threadsafe(lines.put_nowait, line)
+
+        def run():
+            try:
+                return self.command_router.route_for_cache(user_input, on_output=emit)
+            finally:
+                emit(done)
+
+        future = loop.run_in_executor(None, run)
+        while (line := await lines.get()) is not done:
+            yield line
+
+        output, ok = await future
+        if cacheable and ok and output:
+            # The shelve write blocks, like the read above
+            await asyncio.to_thread(self.response_cache.set, self.mode, command, args, output)
+
+    def run_batch(self, tasks, limit: int = 5) -> list:
+        """
+        Run independent commands concurrently and return their outputs.
+
+        Each task is a tuple of (command, *args). Outputs come back in task
+        order; at most `limit` commands talk to the AI provider at once.
+        """
+        return asyncio.run(self._gather(tasks, limit))
+
+    async def _gather(self, tasks, limit: int) -> list:
+        semaphore = asyncio.Semaphore(limit)
+
+        async def run_one(command, *args):
+            async with semaphore:
+                return await asyncio.to_thread(self._collect_output, command, args)
+
+        return await asyncio.gather(*(run_one(*task) for task in tasks))
+
+    def _collect_output(self, command: str, args: tuple) -> str:
+        """Run a command and return its output instead of printing it."""
+        if command in CACHEABLE_COMMANDS:
+            return self._run_cached(command, args)
+        return self.command_router.route(
+            " ".join([command, *args]),
+            return_output=True
+        )
+
+    def _run_cached(self, command: str, args: tuple) -> str:
+        """Run an AI-backed command, reusing output from an identical earlier run."""
+        # Split the way the router does, so run("learn", "docker ps") and
+        # "learn docker ps" share a key
+        args = tuple(" ".join(args).split())
+        output = self.response_cache.get(self.mode, command, args)
+        if output is not None:
+            self._replay_context(command, args)
+            return output
+
+        output, ok = self.command_router.route_for_cache(" ".join([command, *args]))
+        # Errors and fallback answers are shown but not kept
+        if ok and output:
+            self.response_cache.set(self.mode, command, args, output)
+        return output
+
+    def _replay_context(self, command: str, args: tuple) -> None:
+        """Make the session-context update the command's handler would have made."""
+        # Mirrors CommandRouter.cmd_learn and cmd_design; explain records nothing
+        if not args:
+            return
+        if command == "learn":
+            self.context.set_learning_topic(" ".join(args))
+        elif command == "design":
+            self.context.set_architecture(args[0])
+
+
+    def set_mode(self, new_mode: Mode) -> None:
+        """Switch mode in place, keeping the session, history and AI client."""
+        if new_mode == self.mode:
+            return
 
-    def update_mode(self, new_mode: Mode) -> None:
-        """Update the current mode across the app."""
         self.mode = new_mode
 
-        self.session.update_mode(new_mode)
-        self.command_router.update_mode(new_mode)
+        # Anything not built yet picks up the new mode when it is
+        if self._ai is not None:
+            self._ai.mode = new_mode
+        if self._session is not None:
+            self._session.update_mode(new_mode)
+        if self._command_router is not None:
+            self._command_router.update_mode(new_mode)
+
+
+    def update_mode(self, new_mode: Mode) -> None:
+        """Update the current mode across the app."""
+        self.set_mode(new_mode)
 
         # Persist user preference
         save_config(new_mode)
@@ -2,16 +2,17 @@
 Command routing and execution for ClioraOps.
 """
 
-from typing import Dict
+import threading
+from typing import Dict, Tuple
 from clioraOps_cli.core.modes import Mode
-from clioraOps_cli.features.reviewer import CodeReviewer, format_review_result
+from clioraOps_cli.features.reviewer import format_review_result, get_reviewer
 from clioraOps_cli.features.visualizer import (
     ArchitectureVisualizer,
     ArchitecturePattern,
     DiagramFormat,
     format_diagram_result
 )
-from clioraOps_cli.integrations.ai_provider import AIClient
+from clioraOps_cli.integrations.ai_provider import AIClient, AIProviderType
 from clioraOps_cli.features.code_debugger import CodeDebugger, format_debug_result
 from clioraOps_cli.features.code_generator import CodeGenerator, CodeType, format_generated_code
 from clioraOps_cli.features.boilerplate import BoilerplateManager
@@ -31,47 +32,121 @@ class CommandRouter:
         self.context = context
         self.ai = ai
         self.ai_available = ai.is_available
-        self.policy = PolicyManager()
+        # Per-thread output buffer for route(return_output=True)
+        self._output = threading.local()
+        self.policy = PolicyManager(output=self._print)
         
         # Initialize features
-        self.reviewer = CodeReviewer(mode)
-        self.visualizer = ArchitectureVisualizer(mode)
-        self.init_manager = InitManager(mode, ai=self.ai if self.ai_available else None)
+        self.reviewer = get_reviewer(mode)
+        self.visualizer = ArchitectureVisualizer(mode, output=self._print)
+        self.init_manager = InitManager(mode, ai=self.ai if self.ai_available else None, output=self._print)
         
         if not self.ai_available:
-            print("ℹ️  Intelligent feedback DISABLED. Set GEMINI_API_KEY to enable Gemini AI.")
+            self._print("ℹ️  Intelligent feedback DISABLED. Set GEMINI_API_KEY to enable Gemini AI.")
             
         # Initialize features that might use AI
         self.code_generator = CodeGenerator(mode, ai=self.ai if self.ai_available else None)
         self.debugger = CodeDebugger(mode, ai=self.ai if self.ai_available else None, context=context)
-        self.boiler = BoilerplateManager(mode, policy=self.policy)
+        self.boiler = BoilerplateManager(mode, policy=self.policy, output=self._print)
         self.command_generator = CommandGenerator(mode, ai_client=self.ai if self.ai_available else None)
+        
+        # Command mapping, keyed by the first token of the input
+        self._handlers = {
+            'init': self.cmd_init,
+            'try': self.cmd_try,
+            'review': self.cmd_review,
+            'design': self.cmd_design,
+            'learn': self.cmd_learn,
+            'explain': self.cmd_explain,
+            'generate': self.cmd_generate,
+            'debug': self.cmd_debug,
+            'boiler': self.cmd_boiler,
+            'threat': self.cmd_threat,
+            'analyze': self.cmd_analyze,
+            'status': self.cmd_status,
+            'help': self.cmd_help,
+        }
 
     def _check_policy(self, path: str) -> bool:
         """Enforce access control policy."""
         if not self.policy.is_allowed(path):
-            print(f"🚫 Access Denied: Path '{path}' is outside allowed bounds.")
-            print("To allow this path, update your policy at ~/.clioraops/policy.json")
+            self._print(f"🚫 Access Denied: Path '{path}' is outside allowed bounds.")
+            self._print("To allow this path, update your policy at ~/.clioraops/policy.json")
             return False
         return True
     
     def update_mode(self, mode: Mode):
         """Update the current mode."""
         self.mode = mode
-        self.reviewer.mode = mode
+        self.reviewer = get_reviewer(mode)
         self.visualizer.mode = mode
         self.code_generator.mode = mode
         self.debugger.mode = mode
         if self.ai_available:
             self.ai.current_mode = mode
     
-    def route(self, user_input: str):
-        """Route and execute a user command."""
+    def _print(self, message="") -> None:
+        """Print to the console, or collect into the active route(return_output=True) buffer."""
+        buffer = getattr(self._output, "lines", None)
+        if buffer is None:
+            print(message)
+            return
+        
+        buffer.append(str(message))
+        listener = getattr(self._output, "listener", None)
+        if listener is not None:
+            listener(buffer[-1])
+    
+    def route(self, user_input: str, return_output: bool = False, on_output=None):
+        """
+        Route and execute a user command.
+        
+        With return_output=True, the command's output is collected and returned
+        as a string instead of printed (used by the web interface). on_output,
+        if given, is also called with each line as soon as it is produced.
+        """
+        if not return_output:
+            return self._dispatch(user_input)
+        
+        self._output.lines = []
+        self._output.listener = on_output
+        self._output.cacheable = True
+        try:
+            self._dispatch(user_input)
+            return "\n".join(self._output.lines)
+        finally:
+            self._output.lines = None
+            self._output.listener = None
+    
+    def route_for_cache(self, user_input: str, on_output=None) -> Tuple[str, bool]:
+        """
+        Route a command like route(return_output=True), also reporting
+        whether its output may be cached.
+        
+        Output is not cacheable if a handler printed an error, the local
+        fallback's answer, or a notice that AI is unavailable.
+        """
+        output = self.route(user_input, return_output=True, on_output=on_output)
+        return output, self._output.cacheable
+    
+    def _not_cacheable(self) -> None:
+        """Mark the output being collected as unfit for the response cache."""
+        self._output.cacheable = False
+    
+    @staticmethod
+    def _is_cloud_answer(response) -> bool:
+        """Whether an AI response is a real provider answer, not an error or local fallback."""
+        return response.success and response.provider != AIProviderType.LOCAL
+    
+    def _dispatch(self, user_input: str):
+        """Parse user input and call the matching handler."""
         user_input = user_input.strip()
         
         # Check for natural language input
         nl_settings = get_nl_settings()
         if nl_settings["enabled"] and is_natural_language(user_input):
+            # Interactive and AI-generated; never replayed from the cache
+            self._not_cacheable()
             return self._handle_natural_language(user_input)
         
         parts = user_input.split(maxsplit=1)
@@ -81,36 +156,19 @@ class CommandRouter:
         command = parts[0].lower()
         args = parts[1].split() if len(parts) > 1 else []
         
-        # Command mapping
-        handlers = {
-            'init': self.cmd_init,
-            'try': self.cmd_try,
-            'review': self.cmd_review,
-            'design': self.cmd_design,
-            'learn': self.cmd_learn,
-            'explain': self.cmd_explain,
-            'generate': self.cmd_generate,
-            'debug': self.cmd_debug,
-            'boiler': self.cmd_boiler,
-            'threat': self.cmd_threat,
-            'analyze': self.cmd_analyze,
-            'status': self.cmd_status,
-            'help': self.cmd_help,
-        }
-        
-        handler = handlers.get(command)
+        handler = self._handlers.get(command)
         if handler:
             handler(*args)
         else:
-            print(f"❌ Unknown command: {command}")
-            print("Type 'help' for available commands.")
+            self._print(f"❌ Unknown command: {command}")
+            self._print("Type 'help' for available commands.")
             # self.cmd_help() # Clean output
     
     def _handle_natural_language(self, user_input: str):
         """Handle natural language input by classifying intent and routing accordingly."""
         if not self.ai_available:
-            print("⚠️  AI service required for natural language processing.")
-            print("Set GEMINI_API_KEY to enable this feature.")
+            self._print("⚠️  AI service required for natural language processing.")
+            self._print("Set GEMINI_API_KEY to enable this feature.")
             return
         
         # Classify the intent
@@ -128,28 +186,28 @@ class CommandRouter:
     
     def _handle_nl_command(self, user_input: str, confidence: float):
         """Handle NL command intent - generate shell command."""
-        print("\n🤖 Processing natural language command...")
+        self._print("\n🤖 Processing natural language command...")
         result = self.command_generator.generate_command(user_input)
         
         if not result.success:
-            print(f"❌ Could not generate command: {result.error}")
+            self._print(f"❌ Could not generate command: {result.error}")
             return
         
         # Show generated command and explanation
         if self.mode == Mode.BEGINNER:
-            print(f"\n💡 Generated command:\n  {result.command}")
-            print(f"\n📝 {result.explanation}")
+            self._print(f"\n💡 Generated command:\n  {result.command}")
+            self._print(f"\n📝 {result.explanation}")
         else:
-            print(f"💡 {result.command}")
+            self._print(f"💡 {result.command}")
         
         # Show confidence and warnings
         if result.warnings:
-            print(f"\n⚠️  Warnings:")
+            self._print(f"\n⚠️  Warnings:")
             for warning in result.warnings:
-                print(f"  {warning}")
+                self._print(f"  {warning}")
         
         # Run through safety review before execution
-        print(f"\n🔍 Running safety review...")
+        self._print(f"\n🔍 Running safety review...")
         self._review_command_str(result.command)
         
         # Get user confirmation
@@ -164,22 +222,22 @@ class CommandRouter:
                 if execute in ['yes', 'y']:
                     self.cmd_try(result.command)
             except (EOFError, KeyboardInterrupt):
-                print("\n⏸️  Cancelled.")
+                self._print("\n⏸️  Cancelled.")
     
     def _handle_nl_request(self, user_input: str):
         """Handle NL request intent - provide informational response."""
-        print("\n🤖 Processing informational request...")
+        self._print("\n🤖 Processing informational request...")
         # Route to explain feature
-        print(f"📚 Explanation: {user_input}\n")
+        self._print(f"📚 Explanation: {user_input}\n")
         self.cmd_explain(user_input)
     
     def _handle_nl_ambiguous(self, user_input: str, confidence: float):
         """Handle ambiguous intent - ask user to clarify."""
-        print("\n🤖 Processing ambiguous request...")
-        print(f"I'm not sure if you want to:")
-        print(f"  1. Generate and execute a shell command")
-        print(f"  2. Get information/explanation")
-        print(f"\nYour input: \"{user_input}\"")
+        self._print("\n🤖 Processing ambiguous request...")
+        self._print(f"I'm not sure if you want to:")
+        self._print(f"  1. Generate and execute a shell command")
+        self._print(f"  2. Get information/explanation")
+        self._print(f"\nYour input: \"{user_input}\"")
         
         try:
             choice = input("\nWhat would you like? (1/2): ").strip()
@@ -188,50 +246,50 @@ class CommandRouter:
             elif choice == "2":
                 return self._handle_nl_request(user_input)
             else:
-                print("❌ Invalid choice. Please enter 1 or 2.")
+                self._print("❌ Invalid choice. Please enter 1 or 2.")
         except (EOFError, KeyboardInterrupt):
-            print("\n⏸️  Cancelled.")
+            self._print("\n⏸️  Cancelled.")
     
     def cmd_help(self, *args):
         """Show help information."""
-        print("\n🚀 ClioraOps Commands:")
-        print("  init              Initialize current directory and scan for secrets")
-        print("  try <command>     Try a command with a safety review")
-        print("  review <cmd>      Review a shell command for safety issues")
-        print("  design <topic>    Design an architecture visualization")
-        print("  learn <topic>     Learn a DevOps concept")
-        print("  explain <topic>   Explain a specific command or concept")
-        print("  generate <type>   Generate DevOps code/config")
-        print("  debug <error>     Debug a specific error message")
-        print("  boiler <id>       Generate project boilerplate")
+        self._print("\n🚀 ClioraOps Commands:")
+        self._print("  init              Initialize current directory and scan for secrets")
+        self._print("  try <command>     Try a command with a safety review")
+        self._print("  review <cmd>      Review a shell command for safety issues")
+        self._print("  design <topic>    Design an architecture visualization")
+        self._print("  learn <topic>     Learn a DevOps concept")
+        self._print("  explain <topic>   Explain a specific command or concept")
+        self._print("  generate <type>   Generate DevOps code/config")
+        self._print("  debug <error>     Debug a specific error message")
+        self._print("  boiler <id>       Generate project boilerplate")
         
         if self.mode == Mode.ARCHITECT:
-            print("  threat <topic>    AI-powered threat modeling (STRIDE)")
-            print("  analyze <topic>   Deep system design analysis")
+            self._print("  threat <topic>    AI-powered threat modeling (STRIDE)")
+            self._print("  analyze <topic>   Deep system design analysis")
             
-        print("  status            Check AI connectivity and system health")
-        print("\n💡 Natural Language Commands:")
-        print("  Simply describe what you want (e.g., 'show running containers')")
-        print("  ClioraOps will generate and review the command before execution")
-        print("\nType 'exit' to end session.")
+        self._print("  status            Check AI connectivity and system health")
+        self._print("\n💡 Natural Language Commands:")
+        self._print("  Simply describe what you want (e.g., 'show running containers')")
+        self._print("  ClioraOps will generate and review the command before execution")
+        self._print("\nType 'exit' to end session.")
 
     def cmd_threat(self, *args):
         """Perform threat modeling using STRIDE."""
         if self.mode != Mode.ARCHITECT:
-            print("🛡️  Architect Mode REQUIRED: Threat modeling is an advanced design task.")
-            print("Type 'switch to architect' to enable.")
+            self._print("🛡️  Architect Mode REQUIRED: Threat modeling is an advanced design task.")
+            self._print("Type 'switch to architect' to enable.")
             return
 
         if not args:
-            print("Usage: threat <topic_or_architecture>")
+            self._print("Usage: threat <topic_or_architecture>")
             return
 
         topic = args[0]
         if not self.ai_available:
-            print("❌ AI assistance required for threat modeling. Set GEMINI_API_KEY to enable.")
+            self._print("❌ AI assistance required for threat modeling. Set GEMINI_API_KEY to enable.")
             return
 
-        print(f"🕵️  Performing STRIDE threat modeling for: {topic}...")
+        self._print(f"🕵️  Performing STRIDE threat modeling for: {topic}...")
         prompt = f"""Perform a STRIDE threat modeling analysis for the following DevOps architecture or component: {topic}
         
         Please provide:
@@ -242,25 +300,27 @@ class CommandRouter:
         Format as a clear, professional technical report for an architect.
         """
         response = self.ai.chat(prompt)
-        print(response.content if response.success else f"❌ Error: {response.content}")
+        if not self._is_cloud_answer(response):
+            self._not_cacheable()
+        self._print(response.content if response.success else f"❌ Error: {response.content}")
 
     def cmd_analyze(self, *args):
         """Perform deep system design analysis."""
         if self.mode != Mode.ARCHITECT:
-            print("🏗️  Architect Mode REQUIRED: System analysis is an advanced design task.")
-            print("Type 'switch to architect' to enable.")
+            self._print("🏗️  Architect Mode REQUIRED: System analysis is an advanced design task.")
+            self._print("Type 'switch to architect' to enable.")
             return
 
         if not args:
-            print("Usage: analyze <topic_or_architecture>")
+            self._print("Usage: analyze <topic_or_architecture>")
             return
 
         topic = args[0]
         if not self.ai_available:
-            print("❌ AI assistance required for system analysis. Set GEMINI_API_KEY to enable.")
+            self._print("❌ AI assistance required for system analysis. Set GEMINI_API_KEY to enable.")
             return
 
-        print(f"📊 Analyzing system design for: {topic}...")
+        self._print(f"📊 Analyzing system design for: {topic}...")
         prompt = f"""Analyze the system design for: {topic}
         
         Please focus on:
@@ -273,7 +333,9 @@ class CommandRouter:
         Format as a structured technical assessment for a lead DevOps architect.
         """
         response = self.ai.chat(prompt)
-        print(response.content if response.success else f"❌ Error: {response.content}")
+        if not self._is_cloud_answer(response):
+            self._not_cacheable()
+        self._print(response.content if response.success else f"❌ Error: {response.content}")
 
     def cmd_init(self, *args):
         """Initialize the project environment."""
@@ -281,44 +343,44 @@ class CommandRouter:
         results = self.init_manager.initialize_project(path)
         
         if results["secrets_found"]:
-            print("\n🚨  SECURITY ALERT:")
+            self._print("\n🚨  SECURITY ALERT:")
             for issue in results["secrets_found"]:
-                print(f"  [{issue['risk'].upper()}] {issue['file']}: {issue['issue']}")
-            print("\nRun 'clioraOps review <file>' for detailed fixes.")
+                self._print(f"  [{issue['risk'].upper()}] {issue['file']}: {issue['issue']}")
+            self._print("\nRun 'clioraOps review <file>' for detailed fixes.")
         
-        print(f"\n✅ Initialization complete. Project instructions saved to clioraOps-instructions.md")
+        self._print(f"\n✅ Initialization complete. Project instructions saved to clioraOps-instructions.md")
 
     def cmd_try(self, *args):
         """Try a command with safety review."""
         if not args:
-            print("Usage: try <command>")
+            self._print("Usage: try <command>")
             return
         
         command = " ".join(args)
         
         # Safety review
         result = self.reviewer.review_command(command, self.mode)
-        print(format_review_result(result, self.mode))
+        self._print(format_review_result(result, self.mode))
         
         # Track in context
         self.context.add_command(command, result.safe)
         
         # Get AI explanation if available
         if self.ai_available and not result.safe:
-            print("\n🤖 AI Analysis:")
+            self._print("\n🤖 AI Analysis:")
             response = self.ai.explain(command)
-            print(response)
+            self._print(response)
     
     def cmd_design(self, *args):
         """Design or visualize an architecture."""
         if not args:
-            print("\n🏗️  ClioraOps Architecture Designer")
-            print("Usage: design <pattern_or_topic> [--format <ascii|mermaid>]")
+            self._print("\n🏗️  ClioraOps Architecture Designer")
+            self._print("Usage: design <pattern_or_topic> [--format <ascii|mermaid>]")
             
             patterns = self.visualizer.list_available_patterns()
-            print("\nBuilt-in Patterns:")
+            self._print("\nBuilt-in Patterns:")
             for value, name in patterns:
-                print(f"  - {value}")
+                self._print(f"  - {value}")
             return
         
         # Parse arguments
@@ -354,8 +416,9 @@ class CommandRouter:
         else:
             # Generate custom architecture with AI
             if not self.ai_available:
-                print(f"❌ Unknown architecture: {topic}")
-                print("Tip: Enable AI (GEMINI_API_KEY) to design custom architectures!")
+                self._not_cacheable()
+                self._print(f"❌ Unknown architecture: {topic}")
+                self._print("Tip: Enable AI (GEMINI_API_KEY) to design custom architectures!")
                 return
                 
             result = self.visualizer.generate_custom(
@@ -364,31 +427,36 @@ class CommandRouter:
                 include_explanation=True
             )
         
-        print(format_diagram_result(result, self.mode))
+        if not result.success:
+            self._not_cacheable()
+        self._print(format_diagram_result(result, self.mode))
         self.context.set_architecture(topic)
     
     def cmd_learn(self, *args):
         """Learn a concept."""
         if not args:
-            print("Usage: learn <topic>")
+            self._print("Usage: learn <topic>")
             return
         
         topic = " ".join(args)
-        print(f"\n📚 Learning: {topic}")
+        self._print(f"\n📚 Learning: {topic}")
         
         # Use AI for learning logic if available
         if self.ai_available:
              response = self.ai.explain(topic)
-             print(response)
+             if not self._is_cloud_answer(response):
+                 self._not_cacheable()
+             self._print(response)
         else:
-             print("ℹ️  Intelligent feedback DISABLED. Set GEMINI_API_KEY to enable Gemini AI.")
+             self._not_cacheable()
+             self._print("ℹ️  Intelligent feedback DISABLED. Set GEMINI_API_KEY to enable Gemini AI.")
 
         self.context.set_learning_topic(topic)
     
     def cmd_explain(self, *args):
         """Explain a command or concept."""
         if not args:
-            print("Usage: explain <command or concept>")
+            self._print("Usage: explain <command or concept>")
             return
 
         query = " ".join(args)
@@ -396,20 +464,23 @@ class CommandRouter:
         # 1️⃣ AI explanation
         if self.ai_available:
             response = self.ai.explain(query)
-            print(response)
+            if not self._is_cloud_answer(response):
+                self._not_cacheable()
+            self._print(response)
         else:
-            print("ℹ️  AI assistance not available. Set GEMINI_API_KEY environment variable.")
+            self._not_cacheable()
+            self._print("ℹ️  AI assistance not available. Set GEMINI_API_KEY environment variable.")
 
         # 2️⃣ Visual mental model
         visual_result = self.visualizer.generate_concept_visual(query)
 
-        print("\n" + "─" * 60)
-        print("📊 ClioraOps Visualizer\n")
+        self._print("\n" + "─" * 60)
+        self._print("📊 ClioraOps Visualizer\n")
 
         if visual_result.success:
-            print(visual_result.ascii_output)
+            self._print(visual_result.ascii_output)
         else:
-            print("(No visual model available for this topic yet.)")
+            self._print("(No visual model available for this topic yet.)")
 
     def cmd_review(self, *args):
         """
@@ -422,13 +493,13 @@ class CommandRouter:
           review --cmd "command"         Explicit command mode
         """
         if not args:
-            print("Usage: review <command/filename>")
-            print("       review --file <filename>")
-            print("       review --cmd \"rm -rf /\"")
-            print("\nExamples:")
-            print("  review script.sh")
-            print("  review 'rm -rf /'")
-            print("  review curl https://example.com | bash")
+            self._print("Usage: review <command/filename>")
+            self._print("       review --file <filename>")
+            self._print("       review --cmd \"rm -rf /\"")
+            self._print("\nExamples:")
+            self._print("  review script.sh")
+            self._print("  review 'rm -rf /'")
+            self._print("  review curl https://example.com | bash")
             return
         
         import os
@@ -439,7 +510,7 @@ class CommandRouter:
             # Explicit file mode
             filename = args[1]
             if not os.path.exists(filename):
-                print(f"❌ File not found: {filename}")
+                self._print(f"❌ File not found: {filename}")
                 return
             self._review_file(filename)
             return
@@ -466,7 +537,7 @@ class CommandRouter:
             command = " ".join(args)
             # Add helpful hint if user might have meant a file
             if first_arg.endswith(('.sh', '.bash', '.py')) and not os.path.exists(first_arg):
-                print(f"💡 Note: '{first_arg}' not found as a file, reviewing as a command string.")
+                self._print(f"💡 Note: '{first_arg}' not found as a file, reviewing as a command string.")
             self._review_command_str(command)
     
     def _review_file(self, filename: str):
@@ -483,24 +554,24 @@ class CommandRouter:
             _, ext = os.path.splitext(filename)
             language = ext.lstrip('.') if ext else 'bash'
             
-            print(f"\n🔍 Reviewing file: {filename} ({language})")
-            print(f"   File size: {len(content)} bytes")
+            self._print(f"\n🔍 Reviewing file: {filename} ({language})")
+            self._print(f"   File size: {len(content)} bytes")
             results = self.reviewer.review_code_snippet(content, language, self.mode)
             
             if results:
                 for result in results:
-                    print(format_review_result(result, self.mode))
+                    self._print(format_review_result(result, self.mode))
             else:
-                print("✅ No obvious issues detected in file.")
+                self._print("✅ No obvious issues detected in file.")
                 
         except Exception as e:
-            print(f"❌ Error reading file: {e}")
+            self._print(f"❌ Error reading file: {e}")
     
     def _review_command_str(self, command: str):
         """Review a command string for safety issues."""
-        print(f"\n🔍 Reviewing command: {command}")
+        self._print(f"\n🔍 Reviewing command: {command}")
         result = self.reviewer.review_command(command, self.mode)
-        print(format_review_result(result, self.mode))
+        self._print(format_review_result(result, self.mode))
 
     # -------------------------------------------------------------
     # NEW FEATURES
@@ -509,17 +580,17 @@ class CommandRouter:
     def cmd_generate(self, *args):
         """Generate DevOps code."""
         if not args:
-            print("Usage: generate <type> <description>")
-            print("\nAvailable types:")
-            print("  dockerfile        - Generate a Dockerfile")
-            print("  docker-compose    - Generate docker-compose.yml")
-            print("  kubernetes        - Generate Kubernetes manifests")
-            print("  github-actions    - Generate GitHub Actions workflow")
-            print("  ci_pipeline       - Generate CI/CD pipeline config")
-            print("\nExamples:")
-            print("  generate dockerfile 'Python web application'")
-            print("  generate kubernetes 'Node.js deployment'")
-            print("  generate github-actions 'Python test and build'")
+            self._print("Usage: generate <type> <description>")
+            self._print("\nAvailable types:")
+            self._print("  dockerfile        - Generate a Dockerfile")
+            self._print("  docker-compose    - Generate docker-compose.yml")
+            self._print("  kubernetes        - Generate Kubernetes manifests")
+            self._print("  github-actions    - Generate GitHub Actions workflow")
+            self._print("  ci_pipeline       - Generate CI/CD pipeline config")
+            self._print("\nExamples:")
+            self._print("  generate dockerfile 'Python web application'")
+            self._print("  generate kubernetes 'Node.js deployment'")
+            self._print("  generate github-actions 'Python test and build'")
             return
         
         code_type_str = args[0].lower()
@@ -539,10 +610,10 @@ class CommandRouter:
         
         code_type = type_map.get(code_type_str)
         if not code_type:
-            print(f"Unknown type: {code_type_str}")
+            self._print(f"Unknown type: {code_type_str}")
             return
         
-        print(f"\n🔧 Generating {code_type.value}...")
+        self._print(f"\n🔧 Generating {code_type.value}...")
         
         # Extract context from description (language, framework, etc.)
         context = self._extract_context(description)
@@ -551,9 +622,9 @@ class CommandRouter:
         
         # Policy check for output path (default to current dir)
         if not self._check_policy(result.filename):
-            print(f"⚠️  Note: Generated code for {result.filename} cannot be saved automatically due to policy.")
+            self._print(f"⚠️  Note: Generated code for {result.filename} cannot be saved automatically due to policy.")
             
-        print(format_generated_code(result, self.mode))
+        self._print(format_generated_code(result, self.mode))
         
         # Offer to save - interactively? 
         # For CLI usage it's okay, but maybe skipping input is safer for tests/demos.
@@ -583,25 +654,25 @@ class CommandRouter:
     def cmd_debug(self, *args):
         """Debug an error."""
         if not args:
-            print("Usage: debug <error_message>")
-            print("Or paste your error and I'll analyze it")
+            self._print("Usage: debug <error_message>")
+            self._print("Or paste your error and I'll analyze it")
             return
         
         error_message = " ".join(args)
         
-        print("\n🐛 Analyzing error...")
+        self._print("\n🐛 Analyzing error...")
         
         result = self.debugger.debug(error_message)
-        print(format_debug_result(result, self.mode))
+        self._print(format_debug_result(result, self.mode))
 
     def cmd_boiler(self, *args):
         """Generate project boilerplate."""
         if not args:
             templates = self.boiler.list_templates()
-            print("\n🏗️  Common DevOps Templates:")
+            self._print("\n🏗️  Common DevOps Templates:")
             for t in templates:
-                print(f"  {t['id']:<15} - {t['name']}")
-            print("\nUsage: boiler <id_or_url>")
+                self._print(f"  {t['id']:<15} - {t['name']}")
+            self._print("\nUsage: boiler <id_or_url>")
             return
             
         template_input = args[0]
@@ -618,12 +689,12 @@ class CommandRouter:
 
     def cmd_status(self, *args):
         """Check AI connectivity and system health."""
-        print("\n🔍 ClioraOps System Health Check")
-        print("─" * 40)
+        self._print("\n🔍 ClioraOps System Health Check")
+        self._print("─" * 40)
         
         # 1. Gemini Check
         gemini_key = self.ai.active_override == "gemini" or (not self.ai.active_override and "gemini" in [p.name().value for p in self.ai.providers if p.is_available()])
-        print(f"🌟 Gemini AI   : {'✅ Connected' if gemini_key else '❌ Not Configured'}")
+        self._print(f"🌟 Gemini AI   : {'✅ Connected' if gemini_key else '❌ Not Configured'}")
         
         # 2. Local AI (Ollama) Check
         import requests
@@ -631,14 +702,14 @@ class CommandRouter:
             resp = requests.get("http://localhost:11434/api/tags", timeout=2)
             if resp.status_code == 200:
                 models = [m['name'] for m in resp.json().get('models', [])]
-                print(f"🦙 Ollama (Local): ✅ Running ({', '.join(models[:3])})")
+                self._print(f"🦙 Ollama (Local): ✅ Running ({', '.join(models[:3])})")
             else:
-                print(f"🦙 Ollama (Local): ⚠️  Running (Error: {resp.status_code})")
+                self._print(f"🦙 Ollama (Local): ⚠️  Running (Error: {resp.status_code})")
         except:
-            print(f"🦙 Ollama (Local): ❌ Not Running")
+            self._print(f"🦙 Ollama (Local): ❌ Not Running")
             
         # 3. Mode & Policy
-        print(f"🎭 Current Mode : {self.mode.value.upper()}")
-        print(f"🛡️  Paths Allowed: {', '.join(self.policy.allowed_paths)}")
+        self._print(f"🎭 Current Mode : {self.mode.value.upper()}")
+        self._print(f"🛡️  Paths Allowed: {', '.join(self.policy.allowed_paths)}")
         
-        print("\n💡 Tip: If Gemini has quota issues, install Ollama (https://ollama.com) for unlimited local AI!")
\ No newline at end of file
+        self._print("\n💡 Tip: If Gemini has quota issues, install Ollama (https://ollama.com) for unlimited local AI!")
\ No newline at end of file
@@ -4,6 +4,7 @@ Conversational interface for ClioraOps.
 Makes ClioraOps feel like a mentor, not just a command executor.
 """
 
+import re
 from typing import List, Optional, Dict
 from dataclasses import dataclass
 from clioraOps_cli.core.modes import Mode
@@ -11,6 +12,31 @@ from clioraOps_cli.core.context import SessionContext
 from clioraOps_cli.integrations.ai_provider import AIClient
 
 
+CONVERSATIONAL_INDICATORS = (
+    # Questions
+    "what", "how", "why", "when", "where", "who",
+    "can you", "could you", "would you",
+    "do you", "does", "is", "are",
+    
+    # Requests
+    "show me", "tell me", "explain", "help me",
+    "i want", "i need", "i don't understand", "i am", "i'm",
+    "tell", "show", "describe", "analyze",
+    
+    # Follow-ups
+    "yes", "no", "sure", "okay", "ok",
+    "more", "continue", "go on", "next",
+    "example", "demo", "thanks", "thank you",
+)
+
+# One anchored alternation instead of a startswith() per indicator
+CONVERSATIONAL_START_RE = re.compile(
+    "|".join(re.escape(indicator) for indicator in CONVERSATIONAL_INDICATORS)
+)
+
+SINGLE_WORD_REPLIES = frozenset({"yes", "no", "sure", "ok", "okay", "more", "next", "continue"})
+
+
 @dataclass
 class ConversationMessage:
     """A single message in the conversation."""
@@ -26,6 +52,8 @@ class ConversationManager:
     This is what makes ClioraOps feel like a real mentor.
     """
     
+    __slots__ = ("mode", "context", "ai", "conversation_history")
+    
     def __init__(self, mode: Mode, context: SessionContext, ai: AIClient):
         self.mode = mode
         self.context = context
@@ -41,40 +69,14 @@ class ConversationManager:
         - Statements: "I want to", "show me", "tell me about"
         - Follow-ups: "yes", "no", "more", "explain"
         """
-        conversational_indicators = [
-            # Questions
-            "what", "how", "why", "when", "where", "who",
-            "can you", "could you", "would you",
-            "do you", "does", "is", "are",
-            
-            # Requests
-            "show me", "tell me", "explain", "help me",
-            "i want", "i need", "i don't understand", "i am", "i'm",
-            "tell", "show", "describe", "analyze",
-            
-            # Follow-ups
-            "yes", "no", "sure", "okay", "ok",
-            "more", "continue", "go on", "next",
-            "example", "demo", "thanks", "thank you",
-        ]
-        
-        # Check if input starts with any conversational indicator
         input_lower = user_input.lower().strip()
         
         # Single word responses (yes, no, more, etc.)
-        if input_lower in ["yes", "no", "sure", "ok", "okay", "more", "next", "continue"]:
-            return True
-        
-        # Starts with conversational word
-        for indicator in conversational_indicators:
-            if input_lower.startswith(indicator):
-                return True
-        
-        # Contains question mark
-        if "?" in user_input:
+        if input_lower in SINGLE_WORD_REPLIES:
             return True
         
-        return False
+        # Starts with conversational word, or asks a question
+        return bool(CONVERSATIONAL_START_RE.match(input_lower)) or "?" in user_input
     
     def handle_conversation(self, user_input: str) -> str:
         """
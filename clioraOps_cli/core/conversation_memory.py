@@ -0,0 +1,76 @@
+"""
+Bounded chat history for the web interface.
+
+Keeps the most recent turns verbatim and folds everything older into a
+single synopsis turn, so long sessions don't resend the whole transcript
+to the browser (or to the AI) on every message.
+"""
+
+from typing import List, Optional, Tuple
+
+from clioraOps_cli.integrations.ai_provider import AIClient, AIProviderType
+
+
+SYNOPSIS_PREFIX = "📝 Earlier in this conversation: "
+
+
+class ConversationMemory:
+    """
+    Sliding window + summary over Gradio-style (user, assistant) history.
+
+    Once the history grows past `max_recent_turns`, everything except the
+    newest half of the window is summarized into one turn. Compacting to
+    half the window means the summarizer runs every few turns rather than
+    on every message.
+    """
+
+    def __init__(self, max_recent_turns: int = 10, summary_tokens: int = 300):
+        self.max_recent_turns = max_recent_turns
+        self.summary_tokens = summary_tokens
+
+    def compact(self, history: List[Tuple], ai: Optional[AIClient] = None) -> List[Tuple]:
+        """Return history with older turns folded into a synopsis turn."""
+        if len(history) <= self.max_recent_turns:
+            return history
+
+        keep = max(1, self.max_recent_turns // 2)
+        older, recent = history[:-keep], history[-keep:]
+
+        synopsis = self._summarize(older, ai)
+        return [(None, SYNOPSIS_PREFIX + synopsis)] + list(recent)
+
+    def _summarize(self, turns: List[Tuple], ai: Optional[AIClient]) -> str:
+        """Summarize turns with the AI client, falling back to an excerpt."""
+        transcript = self._format_transcript(turns)
+        # Rough budget: ~4 characters per token
+        budget = self.summary_tokens * 4
+
+        if ai is not None:
+            prompt = (
+                f"Summarize this DevOps mentoring conversation in under "
+                f"{self.summary_tokens} tokens. Keep topics covered, commands "
+                f"discussed and open questions.\n\n{transcript}"
+            )
+            try:
+                response = ai.chat(prompt)
+                # The local knowledge base answers with canned templates, not summaries
+                if response.success and response.provider != AIProviderType.LOCAL:
+                    return response.content.strip()[:budget]
+            except Exception:
+                pass
+
+        return transcript[-budget:]
+
+    @staticmethod
+    def _format_transcript(turns: List[Tuple]) -> str:
+        """Flatten turns into 'User:/Assistant:' lines."""
+        lines = []
+        for user_msg, assistant_msg in turns:
+            if user_msg:
+                lines.append(f"User: {user_msg}")
+            if assistant_msg:
+                text = assistant_msg
+                if text.startswith(SYNOPSIS_PREFIX):
+                    text = text[len(SYNOPSIS_PREFIX):]
+                lines.append(f"Assistant: {text}")
+        return "\n".join(lines)
@@ -10,15 +10,17 @@ Handles project initialization, including:
 import os
 from pathlib import Path
 from typing import Dict, List, Optional
-from clioraOps_cli.features.reviewer import CodeReviewer, RiskLevel
+from clioraOps_cli.features.reviewer import RiskLevel, get_reviewer
 
 class InitManager:
     """Manages project initialization and setup."""
     
-    def __init__(self, mode, ai=None):
+    def __init__(self, mode, ai=None, output=print):
         self.mode = mode
         self.ai = ai
-        self.reviewer = CodeReviewer(mode)
+        # Where progress lines go; the router passes its capturing _print
+        self._print = output
+        self.reviewer = get_reviewer(mode)
         
     def initialize_project(self, project_path: str = ".") -> Dict:
         """
@@ -32,19 +34,19 @@ class InitManager:
             "config_created": False
         }
         
-        print(f"🚀 Initializing ClioraOps in: {path}")
+        self._print(f"🚀 Initializing ClioraOps in: {path}")
         
         # 1. Scan for secrets
-        print("🔍 Scanning for secrets and security patterns...")
+        self._print("🔍 Scanning for secrets and security patterns...")
         results["secrets_found"] = self._scan_for_secrets(path)
         
         if results["secrets_found"]:
-            print(f"⚠️  Found {len(results['secrets_found'])} potential security issues!")
+            self._print(f"⚠️  Found {len(results['secrets_found'])} potential security issues!")
         else:
-            print("✅ No major security issues found in the current directory.")
+            self._print("✅ No major security issues found in the current directory.")
             
         # 2. Generate instructions
-        print("📝 Generating clioraOps-instructions.md...")
+        self._print("📝 Generating clioraOps-instructions.md...")
         results["instructions_generated"] = self._generate_instructions(path)
         
         # 3. Create local config if needed
@@ -4,56 +4,119 @@ Distinguishes between natural language requests and explicit commands.
 """
 
 import re
+from functools import lru_cache
+from itertools import islice
 from typing import Tuple
 
 
+def _any_of(words) -> "re.Pattern":
+    """Compile a pattern that finds any of the given words as a substring."""
+    return re.compile("|".join(map(re.escape, sorted(words, key=len, reverse=True))))
+
+
+class _Words:
+    """Input text split once, shared by the detector's checks."""
+    
+    __slots__ = ("text", "lower", "words", "first")
+    
+    def __init__(self, text: str):
+        self.text = text
+        self.lower = text.lower()
+        self.words = self.lower.split()
+        self.first = self.words[0] if self.words else ""
+    
+    @classmethod
+    def of(cls, value) -> "_Words":
+        """Return value as _Words, splitting it if it is still a string."""
+        return value if isinstance(value, cls) else cls(value)
+
+
 class NLDetector:
     """Detects and classifies user input as natural language or explicit command."""
     
     # Explicit command keywords that indicate a structured command
-    EXPLICIT_KEYWORDS = {'try', 'run', 'execute', 'sudo', 'docker', 'git', 'python', 'pip', 'npm', 'yarn'}
+    EXPLICIT_KEYWORDS = frozenset({'try', 'run', 'execute', 'sudo', 'docker', 'git', 'python', 'pip', 'npm', 'yarn'})
     
     # NL trigger words that suggest natural language intent
-    NL_TRIGGERS = {
+    NL_TRIGGERS = frozenset({
         'show', 'list', 'find', 'search', 'display', 'print', 'what', 'how', 'why',
         'tell', 'convert', 'translate', 'generate', 'create', 'build', 'make',
         'check', 'verify', 'compare', 'analyze', 'count', 'sum', 'sort',
         'help', 'explain', 'summarize', 'describe', 'list all', 'give me',
         'can you', 'could you', 'please', 'get me', 'show me', 'do you'
-    }
+    })
     
     # Patterns that indicate explicit command syntax
     EXPLICIT_PATTERNS = [
         r'^try\s+',                    # starts with 'try'
         r'^\s*\$',                     # starts with shell prompt $
         r'^[a-z]+\s+[-]',              # command with flags (e.g., 'docker -ps')
-        r'[|>]',                        # contains pipes or redirects
-        r'&&|\|\||;',                  # contains command chaining
     ]
     
+    # Pipes, redirects and ';' chaining ('||' contains '|'); '&&' is checked
+    # separately since a lone '&' is not an operator here
+    SHELL_OPERATOR_CHARS = frozenset('|>;')
+    
     # Question words indicating informational requests
-    QUESTION_WORDS = {'what', 'why', 'how', 'when', 'which', 'who', 'where', 'what\'s', "what's"}
+    QUESTION_WORDS = frozenset({'what', 'why', 'how', 'when', 'which', 'who', 'where', 'what\'s', "what's"})
     
     # Action verbs indicating operational commands
-    ACTION_VERBS = {
+    ACTION_VERBS = frozenset({
         'show', 'find', 'list', 'count', 'check', 'get', 'search', 'display', 'locate',
         'run', 'execute', 'do', 'perform', 'make', 'create', 'build', 'fetch', 'retrieve'
-    }
+    })
     
     # System targets/objects (things users operate on)
-    SYSTEM_TARGETS = {
+    SYSTEM_TARGETS = frozenset({
         'container', 'containers', 'image', 'images', 'service', 'services',
         'file', 'files', 'directory', 'folder', 'process', 'processes',
         'port', 'ports', 'user', 'users', 'group', 'groups', 'package', 'packages',
         'network', 'networks', 'volume', 'volumes', 'database', 'databases',
         'log', 'logs', 'config', 'configuration', 'resource', 'resources'
-    }
+    })
     
     # Concept verbs indicating informational requests (not operational)
-    CONCEPT_VERBS = {
+    CONCEPT_VERBS = frozenset({
         'explain', 'describe', 'define', 'understand', 'tell', 'teach',
         'compare', 'difference', 'versus', 'vs', 'benefit', 'advantage'
-    }
+    })
+    
+    # Verbs that make an input read as an imperative when they come first
+    IMPERATIVE_VERBS = frozenset({
+        'show', 'list', 'find', 'search', 'display', 'print',
+        'get', 'fetch', 'retrieve', 'convert', 'generate',
+        'create', 'build', 'check', 'verify', 'analyze'
+    })
+    
+    # Smaller word groups used by classify_nl_intent
+    LISTING_ACTIONS = frozenset({'find', 'list', 'show', 'count'})
+    LEARNING_WORDS = frozenset({'learn', 'understand', 'know', 'help me'})
+    COMPARISON_WORDS = frozenset({'difference', 'versus', 'vs', 'compared', 'similar'})
+    ABSTRACT_WORDS = frozenset({'concept', 'idea', 'example', 'benefit', 'advantage'})
+    
+    # Phrasing typical of natural language
+    NL_STRUCTURE_PATTERNS = [
+        r'all\s+\w+',                 # "all files"
+        r'(?:larger|smaller|bigger|newer)\s+than',  # comparisons
+        r'(?:in|from|to|for)\s+\w+',  # prepositions
+        r'\b(?:with|without|using)\b', # with/without
+    ]
+    
+    # Each group compiled once into a single scan; these keep the plain
+    # substring semantics of `any(word in text for word in group)`
+    _NL_TRIGGER_RE = _any_of(NL_TRIGGERS)
+    _ACTION_VERB_RE = _any_of(ACTION_VERBS)
+    _SYSTEM_TARGET_RE = _any_of(SYSTEM_TARGETS)
+    _CONCEPT_VERB_RE = _any_of(CONCEPT_VERBS)
+    _LISTING_ACTION_RE = _any_of(LISTING_ACTIONS)
+    _LEARNING_RE = _any_of(LEARNING_WORDS)
+    _COMPARISON_RE = _any_of(COMPARISON_WORDS)
+    _ABSTRACT_RE = _any_of(ABSTRACT_WORDS)
+    _EXPLICIT_RE = re.compile("|".join(f"(?:{pattern})" for pattern in EXPLICIT_PATTERNS))
+    _NL_STRUCTURE_RE = re.compile(
+        "|".join(f"(?:{pattern})" for pattern in NL_STRUCTURE_PATTERNS),
+        re.IGNORECASE
+    )
     
     @classmethod
     def is_natural_language(cls, user_input: str) -> Tuple[bool, str]:
@@ -68,24 +131,37 @@ class NLDetector:
             - is_nl: True if input is natural language
             - classification: Reason for classification ("NL", "EXPLICIT", "AMBIGUOUS")
         """
-        user_input = user_input.strip()
-        
+        return cls._detect_nl(user_input.strip())
+    
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _detect_nl(cls, user_input: str) -> Tuple[bool, str]:
+        """Detection behind is_natural_language, memoized on the stripped input."""
         if not user_input:
             return False, "EMPTY"
         
-        # Check for explicit command patterns first (high confidence)
-        for pattern in cls.EXPLICIT_PATTERNS:
-            if re.search(pattern, user_input):
-                return False, "EXPLICIT"
+        words = _Words(user_input)
+        
+        # Starting with an explicit keyword decides it in one set lookup, so
+        # check that before scanning for explicit command patterns
+        if words.first in cls.EXPLICIT_KEYWORDS:
+            return False, "EXPLICIT"
+        
+        # Shell operators: one pass over the characters, no regex needed
+        if not cls.SHELL_OPERATOR_CHARS.isdisjoint(user_input) or '&&' in user_input:
+            return False, "EXPLICIT"
         
-        # Check if starts with explicit keyword
-        first_word = user_input.split()[0].lower()
-        if first_word in cls.EXPLICIT_KEYWORDS:
+        # Check for explicit command patterns (high confidence)
+        if cls._EXPLICIT_RE.match(user_input):
             return False, "EXPLICIT"
         
-        # Check for natural language triggers
-        lower_input = user_input.lower()
-        trigger_count = sum(1 for trigger in cls.NL_TRIGGERS if trigger in lower_input)
+        # Check for natural language triggers; only 0, 1 or 2+ matters
+        lower_input = words.lower
+        if cls._NL_TRIGGER_RE.search(lower_input):
+            found = (trigger for trigger in cls.NL_TRIGGERS if trigger in lower_input)
+            trigger_count = sum(1 for _ in islice(found, 2))
+        else:
+            trigger_count = 0
         
         # If multiple NL triggers found, likely NL
         if trigger_count >= 2:
@@ -93,31 +169,24 @@ class NLDetector:
         
         # If at least one NL trigger and input is a question or imperative
         if trigger_count >= 1:
-            if '?' in user_input or cls._is_imperative(user_input):
+            if '?' in user_input or cls._is_imperative(words):
                 return True, "NL"
         
         # Check for very short input (likely explicit)
-        if len(user_input.split()) <= 2:
+        if len(words.words) <= 2:
             return False, "EXPLICIT"
         
         # If input contains typical NL structure (longer, natural phrasing)
-        if cls._has_nl_structure(user_input):
+        if cls._has_nl_structure(words):
             return True, "NL"
         
         # Default to explicit for ambiguous cases
         return False, "AMBIGUOUS"
     
-    @staticmethod
-    def _is_imperative(text: str) -> bool:
-        """Check if text appears to be an imperative command."""
-        # Common imperative verbs at start
-        imperatives = {
-            'show', 'list', 'find', 'search', 'display', 'print',
-            'get', 'fetch', 'retrieve', 'convert', 'generate',
-            'create', 'build', 'check', 'verify', 'analyze'
-        }
-        first_word = text.split()[0].lower()
-        return first_word in imperatives
+    @classmethod
+    def _is_imperative(cls, text) -> bool:
+        """Check if text (a string or _Words) appears to be an imperative command."""
+        return _Words.of(text).first in cls.IMPERATIVE_VERBS
     
     @classmethod
     def classify_nl_intent(cls, user_input: str) -> Tuple[str, float]:
@@ -137,28 +206,34 @@ class NLDetector:
             - intent: "command", "request", or "ambiguous"
             - confidence: Float between 0.0 and 1.0 (higher = more certain)
         """
-        user_input = user_input.strip().lower()
-        
+        return cls._classify(user_input.strip())
+    
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _classify(cls, user_input: str) -> Tuple[str, float]:
+        """Classification behind classify_nl_intent, memoized on the stripped input."""
         if not user_input:
             return "ambiguous", 0.5
         
+        words = _Words(user_input)
+        user_input = words.lower
+        
         # TIER 1: Question words (95%+ confidence -> REQUEST)
         # Check this FIRST - question words override everything
-        first_word = user_input.split()[0]
-        if first_word in cls.QUESTION_WORDS:
+        if words.first in cls.QUESTION_WORDS:
             return "request", 0.95
         
         # TIER 2: Concept verbs (88%+ confidence -> REQUEST)
-        if any(verb in user_input for verb in cls.CONCEPT_VERBS):
+        if cls._CONCEPT_VERB_RE.search(user_input):
             # But check if it's actually action-based (e.g., "compare files")
-            if any(target in user_input for target in cls.SYSTEM_TARGETS):
-                if any(action in user_input for action in {'find', 'list', 'show', 'count'}):
+            if cls._SYSTEM_TARGET_RE.search(user_input):
+                if cls._LISTING_ACTION_RE.search(user_input):
                     return "command", 0.75  # e.g., "compare files"
             return "request", 0.88
         
         # TIER 3: Action verbs + System targets (90%+ confidence -> COMMAND)
-        has_action_verb = any(verb in user_input for verb in cls.ACTION_VERBS)
-        has_system_target = any(target in user_input for target in cls.SYSTEM_TARGETS)
+        has_action_verb = cls._ACTION_VERB_RE.search(user_input) is not None
+        has_system_target = cls._SYSTEM_TARGET_RE.search(user_input) is not None
         
         if has_action_verb and has_system_target:
             return "command", 0.90
@@ -166,47 +241,37 @@ class NLDetector:
         if has_action_verb:
             # Just action verb without clear target
             # Check if it's a learning context
-            if any(word in user_input for word in {'learn', 'understand', 'know', 'help me'}):
+            if cls._LEARNING_RE.search(user_input):
                 return "request", 0.70
             return "command", 0.75
         
         # TIER 4: Comparison/difference keywords (88%+ confidence -> REQUEST)
-        if any(word in user_input for word in {'difference', 'versus', 'vs', 'compared', 'similar'}):
+        if cls._COMPARISON_RE.search(user_input):
             return "request", 0.88
         
         # TIER 5: "show/list me" patterns
         if re.search(r'(show|give|get)\s+me\s+', user_input):
-            if any(target in user_input for target in cls.SYSTEM_TARGETS):
+            if has_system_target:
                 return "command", 0.92
             # "show me concepts" - ambiguous
-            if any(word in user_input for word in {'concept', 'idea', 'example', 'benefit', 'advantage'}):
+            if cls._ABSTRACT_RE.search(user_input):
                 return "ambiguous", 0.60
             return "command", 0.80
         
         # Default: Ambiguous
         return "ambiguous", 0.50
 
-    @staticmethod
-    def _has_nl_structure(text: str) -> bool:
-        """Check if text has natural language structure."""
-        word_count = len(text.split())
+    @classmethod
+    def _has_nl_structure(cls, text) -> bool:
+        """Check if text (a string or _Words) has natural language structure."""
+        words = _Words.of(text)
+        word_count = len(words.words)
         # Longer inputs are more likely to be NL
         if word_count >= 4:
             return True
         
         # Check for natural phrasing patterns
-        nl_patterns = [
-            r'all\s+\w+',                 # "all files"
-            r'(?:larger|smaller|bigger|newer)\s+than',  # comparisons
-            r'(?:in|from|to|for)\s+\w+',  # prepositions
-            r'\b(?:with|without|using)\b', # with/without
-        ]
-        
-        for pattern in nl_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-        
-        return False
+        return cls._NL_STRUCTURE_RE.search(words.text) is not None
 
 
 def is_natural_language(user_input: str) -> bool:
@@ -11,10 +11,12 @@ class PolicyManager:
     security and bounded interaction.
     """
     
-    def __init__(self, config_dir: Optional[Path] = None):
+    def __init__(self, config_dir: Optional[Path] = None, output=print):
         if config_dir is None:
             config_dir = Path.home() / ".clioraops"
-            
+        
+        # Where warnings go; the router passes its capturing _print
+        self._print = output
         self.config_path = config_dir / "policy.json"
         self.allowed_paths: List[Path] = []
         self.load_policy()
@@ -33,7 +35,7 @@ class PolicyManager:
                 paths = data.get("allowed_paths", [])
                 self.allowed_paths = [Path(p).expanduser().resolve() for p in paths]
         except (json.JSONDecodeError, IOError) as e:
-            print(f"⚠️  Failed to load policy: {e}")
+            self._print(f"⚠️  Failed to load policy: {e}")
             self.allowed_paths = [Path.cwd()]
             
     def _save_policy(self):
@@ -57,13 +59,13 @@ class PolicyManager:
             except ValueError:
                 continue
         
-        print(f"\n🚫  POLICY VIOLATION: Access to '{path}' is blocked.")
-        print(f"    Current allowed paths are:")
+        self._print(f"\n🚫  POLICY VIOLATION: Access to '{path}' is blocked.")
+        self._print(f"    Current allowed paths are:")
         for p in self.allowed_paths:
-            print(f"      - {p}")
-        print(f"\n💡  To allow this path, edit your policy file at:")
-        print(f"    {self.config_path}")
-        print(f"    Or run: clioraOps policy --add {path} (Coming soon!)")
+            self._print(f"      - {p}")
+        self._print(f"\n💡  To allow this path, edit your policy file at:")
+        self._print(f"    {self.config_path}")
+        self._print(f"    Or run: clioraOps policy --add {path} (Coming soon!)")
         
         return False
 
@@ -0,0 +1,99 @@
+"""
+Response cache for repeated ClioraOps commands.
+
+Keeps the rendered output of AI-backed commands (learn, explain, design)
+so asking the same thing again doesn't cost another provider round-trip.
+"""
+
+import hashlib
+import json
+import shelve
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Sequence
+
+from clioraOps_cli.core.modes import Mode
+
+
+# Commands whose output depends only on (mode, command, args)
+CACHEABLE_COMMANDS = frozenset({"learn", "explain", "design"})
+
+
+class ResponseCache:
+    """
+    Two-level cache: an in-memory LRU in front of a shelve file.
+
+    Entries expire after `ttl` seconds. Disk errors are swallowed so a
+    broken cache file never breaks a command.
+    """
+
+    def __init__(
+        self,
+        config_dir: Optional[Path] = None,
+        ttl: int = 86400,
+        max_memory_entries: int = 128,
+    ):
+        if config_dir is None:
+            config_dir = Path.home() / ".clioraops"
+
+        self.cache_path = config_dir / "cache.db"
+        self.ttl = ttl
+        self.max_memory_entries = max_memory_entries
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(mode: Mode, command: str, args: Sequence[str]) -> str:
+        """Content-addressed key for a command invocation."""
+        raw = f"{mode.value}|{command}|{json.dumps(list(args))}"
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def get(self, mode: Mode, command: str, args: Sequence[str]) -> Optional[str]:
+        """Return cached output, or None on miss/expiry."""
+        key = self.make_key(mode, command, args)
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                entry = self._read_disk(key)
+            if entry is None:
+                return None
+
+            stored_at, output = entry
+            if time.time() - stored_at > self.ttl:
+                self._memory.pop(key, None)
+                return None
+
+            self._remember(key, entry)
+            return output
+
+    def set(self, mode: Mode, command: str, args: Sequence[str], output: str) -> None:
+        """Store command output."""
+        key = self.make_key(mode, command, args)
+        entry = (time.time(), output)
+
+        with self._lock:
+            self._remember(key, entry)
+            try:
+                self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+                with shelve.open(str(self.cache_path)) as db:
+                    db[key] = entry
+            except Exception:
+                pass
+
+    def _remember(self, key: str, entry: tuple) -> None:
+        """Insert into the in-memory LRU, evicting the oldest entry."""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _read_disk(self, key: str) -> Optional[tuple]:
+        """Load an entry from the shelve file, if present."""
+        try:
+            with shelve.open(str(self.cache_path), flag="r") as db:
+                return db.get(key)
+        except Exception:
+            return None
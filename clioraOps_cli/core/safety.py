@@ -0,0 +1,59 @@
+"""
+Fast syntactic safety checks for shell commands.
+
+Catches commands that are dangerous on sight (rm -rf /, curl | bash, ...)
+with one precompiled pattern, before any review or AI round-trip.
+The full, explained review lives in features/reviewer.py.
+"""
+
+from typing import Iterable, List
+
+try:
+    # RE2 guarantees linear-time matching when google-re2 is installed
+    import re2 as _re
+except ImportError:
+    import re as _re
+
+try:
+    # JIT prefilter for large batches when numba is installed
+    from clioraOps_cli.core.safety_numba import find_marker_hits
+except ImportError:
+    find_marker_hits = None
+
+
+DANGER_RE = _re.compile(
+    r"(?i)"
+    r"\brm\s+-rf\s+/"          # recursive delete from root
+    r"|\bchmod\s+777"          # world-writable permissions
+    r"|\|\s*(?:ba|z)?sh\b"     # piping into a shell
+    r"|\beval\s"               # eval of dynamic input
+    r"|\bdd\s+if="             # raw disk writes
+    r"|\bmkfs\."               # formatting a filesystem
+    r"|:\(\)\s*\{"             # fork bomb
+)
+
+# Every DANGER_RE match contains at least one of these (casefolded)
+DANGER_MARKERS = ("rm", "chmod", "|", "eval", "dd", "mkfs", ":(")
+
+# Below this, JIT dispatch and packing cost more than the regex loop
+JIT_MIN_BATCH = 1000
+
+
+def is_obviously_dangerous(command: str) -> bool:
+    """Return True if the command matches a known-destructive pattern."""
+    return DANGER_RE.search(command) is not None
+
+
+def classify_batch(commands: Iterable[str]) -> List[bool]:
+    """
+    Apply is_obviously_dangerous to many commands, e.g. a shell history.
+
+    With numba installed, large batches are first scanned in parallel for
+    DANGER_MARKERS and only the commands containing one go through the regex.
+    """
+    commands = list(commands)
+    if find_marker_hits is None or len(commands) < JIT_MIN_BATCH:
+        return [is_obviously_dangerous(command) for command in commands]
+
+    hits = find_marker_hits(commands, DANGER_MARKERS)
+    return [bool(hit) and is_obviously_dangerous(command) for hit, command in zip(hits, commands)]
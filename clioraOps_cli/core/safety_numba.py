@@ -0,0 +1,51 @@
+"""
+Numba kernel for scanning large command batches.
+
+Imported optionally by core/safety.py; importing this module fails with
+ImportError when numba or numpy is not installed.
+"""
+
+import numba
+import numpy as np
+
+
+@numba.njit(cache=True)
+def _contains_any(buf, start, end, markers, marker_offsets):
+    """Whether buf[start:end] contains any of the packed markers."""
+    for k in range(len(marker_offsets) - 1):
+        m_start = marker_offsets[k]
+        size = marker_offsets[k + 1] - m_start
+        for i in range(start, end - size + 1):
+            j = 0
+            while j < size and buf[i + j] == markers[m_start + j]:
+                j += 1
+            if j == size:
+                return True
+    return False
+
+
+@numba.njit(cache=True, parallel=True)
+def _scan(buf, offsets, markers, marker_offsets):
+    out = np.zeros(len(offsets) - 1, dtype=np.uint8)
+    for i in numba.prange(len(offsets) - 1):
+        if _contains_any(buf, offsets[i], offsets[i + 1], markers, marker_offsets):
+            out[i] = 1
+    return out
+
+
+def _pack(items):
+    """Concatenate byte strings into one uint8 array plus start offsets."""
+    offsets = np.zeros(len(items) + 1, dtype=np.int64)
+    np.cumsum([len(item) for item in items], out=offsets[1:])
+    return np.frombuffer(b"".join(items), dtype=np.uint8), offsets
+
+
+def find_marker_hits(commands, markers):
+    """
+    Flag commands whose casefolded text contains any marker.
+
+    Returns a uint8 array with one entry per command.
+    """
+    buf, offsets = _pack([command.casefold().encode("utf-8") for command in commands])
+    marker_buf, marker_offsets = _pack([marker.encode("utf-8") for marker in markers])
+    return _scan(buf, offsets, marker_buf, marker_offsets)
@@ -12,9 +12,11 @@ from clioraOps_cli.config.settings import save_config
 class SessionManager:
     """Manages interactive session state."""
 
-    def __init__(self, mode: Mode, ollama=None):
+    __slots__ = ("mode", "context", "conversation")
+
+    def __init__(self, mode: Mode, ollama=None, context: SessionContext = None):
         self.mode = mode
-        self.context = SessionContext()
+        self.context = context if context is not None else SessionContext()
 
         # Optional conversational layer
         if ollama:
@@ -229,16 +229,18 @@ class BoilerplateManager:
         ],
     }
     
-    def __init__(self, mode, policy=None):
+    def __init__(self, mode, policy=None, output=print):
         """
         Initialize boilerplate manager.
         
         Args:
             mode: Execution mode (beginner/architect)
             policy: AccessPolicy instance for security checks
+            output: Callable that receives each status line (defaults to print)
         """
         self.mode = mode
         self.policy = policy
+        self._print = output
         
     def list_all_templates(self) -> Dict[str, List[BoilerplateTemplate]]:
         """
@@ -324,7 +326,7 @@ class BoilerplateManager:
         """
         # Check policy
         if self.policy and not self.policy.is_operation_allowed("create", output_dir):
-            print(f"🚫 Access Denied: Cannot generate in '{output_dir}'")
+            self._print(f"🚫 Access Denied: Cannot generate in '{output_dir}'")
             return False
         
         # Try to get template by ID first
@@ -334,7 +336,7 @@ class BoilerplateManager:
         if not template:
             if template_id_or_url.startswith(("http://", "https://", "file://")):
                 # Direct URL provided
-                print(f"🚀 Generating boilerplate from {template_id_or_url}...")
+                self._print(f"🚀 Generating boilerplate from {template_id_or_url}...")
                 try:
                     from cookiecutter.main import cookiecutter as run_cookiecutter
                     result = run_cookiecutter(
@@ -343,35 +345,35 @@ class BoilerplateManager:
                         output_dir=output_dir,
                         extra_context=kwargs.get("extra_context", {})
                     )
-                    print(f"✅ Successfully generated at: {result}")
+                    self._print(f"✅ Successfully generated at: {result}")
                     return True
                 except ImportError:
-                    print("❌ 'cookiecutter' is not installed")
-                    print("💡 Install it with: pip install cookiecutter")
+                    self._print("❌ 'cookiecutter' is not installed")
+                    self._print("💡 Install it with: pip install cookiecutter")
                     return False
                 except Exception as e:
-                    print(f"❌ Generation failed: {e}")
+                    self._print(f"❌ Generation failed: {e}")
                     return False
             else:
-                print(f"❌ Template not found: {template_id_or_url}")
+                self._print(f"❌ Template not found: {template_id_or_url}")
                 return False
         
         # Validate template
         if not self.validate_template(template):
-            print(f"❌ Template is invalid or inaccessible: {template.id}")
+            self._print(f"❌ Template is invalid or inaccessible: {template.id}")
             return False
         
-        print(f"🚀 Generating {template.name}...")
-        print(f"   From: {template.url}")
-        print(f"   To: {output_dir}")
+        self._print(f"🚀 Generating {template.name}...")
+        self._print(f"   From: {template.url}")
+        self._print(f"   To: {output_dir}")
         
         try:
             # Check if cookiecutter is installed
             try:
                 from cookiecutter.main import cookiecutter as run_cookiecutter
             except ImportError:
-                print("❌ 'cookiecutter' is not installed")
-                print("💡 Install it with: pip install cookiecutter")
+                self._print("❌ 'cookiecutter' is not installed")
+                self._print("💡 Install it with: pip install cookiecutter")
                 return False
             
             # Run cookiecutter
@@ -382,11 +384,11 @@ class BoilerplateManager:
                 extra_context=kwargs.get("extra_context", {})
             )
             
-            print(f"✅ Successfully generated at: {result}")
+            self._print(f"✅ Successfully generated at: {result}")
             return True
             
         except Exception as e:
-            print(f"❌ Generation failed: {e}")
+            self._print(f"❌ Generation failed: {e}")
             return False
     
     def get_template_info(self, template_id: str) -> Optional[str]:
@@ -415,9 +417,9 @@ class BoilerplateManager:
     def print_all_templates(self) -> None:
         """Print all templates organized by category."""
         for category, templates in self.TEMPLATES.items():
-            print(f"\n📁 {category.upper()} ({len(templates)} templates)")
-            print("-" * 60)
+            self._print(f"\n📁 {category.upper()} ({len(templates)} templates)")
+            self._print("-" * 60)
             
             for template in templates:
-                print(f"  • {template.id}: {template.name}")
-                print(f"    {template.description}")
+                self._print(f"  • {template.id}: {template.name}")
+                self._print(f"    {template.description}")
@@ -26,6 +26,9 @@ class CommandGenerator:
         r'systemctl\s+(?:stop|disable|mask)',  # stopping services
     ]
     
+    # Compiled once when the class is created, paired with their source for warnings
+    _DANGEROUS_RES = [(pattern, re.compile(pattern, re.IGNORECASE)) for pattern in DANGEROUS_PATTERNS]
+    
     # Safe command confidence patterns (high confidence)
     SAFE_COMMANDS = {
         'ls', 'cat', 'grep', 'find', 'echo', 'pwd', 'whoami',
@@ -194,8 +197,8 @@ Requirements:
         warnings = []
         
         # Check for dangerous patterns
-        for pattern in self.DANGEROUS_PATTERNS:
-            if re.search(pattern, command, re.IGNORECASE):
+        for pattern, regex in self._DANGEROUS_RES:
+            if regex.search(command):
                 warnings.append(f"⚠️ Potentially dangerous pattern detected: {pattern}")
         
         # Warn about interactive prompts
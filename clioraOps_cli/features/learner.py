@@ -1,4 +1,4 @@
-from ui.prompts import BEGINNER_PROMPT
+from clioraOps_cli.ui.prompts import BEGINNER_PROMPT
 from clioraOps_cli.utils.logger import log_learning_session
 
 
@@ -6,7 +6,7 @@ def handle_beginner(topic, user_input, ai_client):
     """
     Handles a beginner learning session using the AI client and returns the response.
     """
-    prompt = BEGINNER_PROMPT.format(
+    prompt = BEGINNER_PROMPT.substitute(
         topic=topic,
         input=user_input
     )
@@ -10,9 +10,30 @@ Provides intelligent code and command review with:
 
 from enum import Enum
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 import re
 
+from clioraOps_cli.core.modes import Mode
+
+
+# An escape sequence, or a run of text without one
+_ESCAPE_OR_TEXT = re.compile(r'\\.|[^\\]+')
+
+
+def _lowercase_pattern(pattern: str) -> str:
+    """
+    Lowercase a regex's literal text, leaving escapes such as \\S or \\W alone.
+
+    Matching the lowercased pattern against lowercased input is equivalent
+    to re.IGNORECASE for the ASCII patterns used here, without the engine
+    folding case at every character.
+    """
+    return _ESCAPE_OR_TEXT.sub(
+        lambda m: m.group() if m.group().startswith('\\') else m.group().lower(),
+        pattern,
+    )
+
 
 class RiskLevel(Enum):
     """Risk levels for commands and code."""
@@ -38,6 +59,11 @@ class ReviewResult:
 class CommandPattern:
     """Represents a dangerous command pattern with context."""
     
+    __slots__ = (
+        "pattern", "risk_level", "description", "beginner_explanation",
+        "architect_explanation", "safe_alternative", "learning_note", "_regex",
+    )
+    
     def __init__(
         self,
         pattern: str,
@@ -55,16 +81,28 @@ class CommandPattern:
         self.architect_explanation = architect_explanation
         self.safe_alternative = safe_alternative
         self.learning_note = learning_note
-        self.regex = re.compile(pattern, re.IGNORECASE)
+        
+        # Compiled on first use, so importing the module stays cheap
+        self._regex = None
+    
+    @property
+    def regex(self) -> "re.Pattern":
+        """The lowercased pattern, compiled case-sensitively; search it with lowercased text."""
+        if self._regex is None:
+            self._regex = re.compile(_lowercase_pattern(self.pattern))
+        return self._regex
     
     def matches(self, command: str) -> bool:
-        """Check if command matches this dangerous pattern."""
-        return bool(self.regex.search(command))
+        """Check if command matches this dangerous pattern, ignoring case."""
+        return self.regex.search(command.lower()) is not None
 
 
 class CodeReviewer:
     """
     Reviews commands and code for safety and provides educational feedback.
+    
+    A reviewer is not modified after construction (callers pass a different
+    mode per call instead), so get_reviewer() can share one per mode.
     """
     
     # Define dangerous command patterns
@@ -508,6 +546,11 @@ class CodeReviewer:
         ),
     ]
     
+    # Most severe first (RiskLevel is declared in ascending order), so the
+    # first match review_command returns is also the worst one. The sort is
+    # stable, so patterns of equal risk keep the order above.
+    DANGEROUS_PATTERNS.sort(key=lambda p: list(RiskLevel).index(p.risk_level), reverse=True)
+    
     def __init__(self, mode=None):
         """Initialize the code reviewer."""
         # Mode will be passed in from the main app
@@ -528,9 +571,9 @@ class CodeReviewer:
         current_mode = mode or self.mode
         
         # Check against all dangerous patterns
-        for pattern in self.DANGEROUS_PATTERNS:
-            if pattern.matches(command):
-                return self._create_review_result(pattern, current_mode)
+        pattern = self._first_match(command)
+        if pattern is not None:
+            return self._create_review_result(pattern, current_mode)
         
         # Command appears safe
         return ReviewResult(
@@ -541,6 +584,14 @@ class CodeReviewer:
             proceed=True
         )
     
+    def _first_match(self, command: str) -> Optional[CommandPattern]:
+        """Return the most severe pattern matching command, or None."""
+        lowered = command.lower()
+        for pattern in self.DANGEROUS_PATTERNS:
+            if pattern.regex.search(lowered):
+                return pattern
+        return None
+    
     def _create_review_result(
         self, 
         pattern: CommandPattern, 
@@ -603,8 +654,9 @@ class CodeReviewer:
                 continue
             
             # Check line against patterns
+            lowered = line.lower()
             for pattern in self.DANGEROUS_PATTERNS:
-                if pattern.matches(line):
+                if pattern.regex.search(lowered):
                     result = self._create_review_result(pattern, current_mode)
                     result.message = f"Line {line_num}: {result.message}"
                     results.append(result)
@@ -625,9 +677,9 @@ class CodeReviewer:
         # This could be expanded with a database of command explanations
         # For now, focus on the dangerous ones we know about
         
-        for pattern in self.DANGEROUS_PATTERNS:
-            if pattern.matches(command):
-                return pattern.beginner_explanation
+        pattern = self._first_match(command)
+        if pattern is not None:
+            return pattern.beginner_explanation
         
         # Generic safe command explanation
         return (
@@ -636,6 +688,12 @@ class CodeReviewer:
         )
 
 
+@lru_cache(maxsize=len(Mode))
+def get_reviewer(mode: Mode) -> CodeReviewer:
+    """Return the shared CodeReviewer for mode."""
+    return CodeReviewer(mode)
+
+
 def format_review_result(result: ReviewResult, mode=None) -> str:
     """
     Format a ReviewResult for display to the user.
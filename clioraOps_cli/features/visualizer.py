@@ -24,10 +24,11 @@ class ArchitectureVisualizer:
     Main visualizer class for generating architecture diagrams.
     """
     
-    def __init__(self, mode=None, ai=None):
-        """Initialize the visualizer."""
+    def __init__(self, mode=None, ai=None, output=print):
+        """Initialize the visualizer; output receives progress lines."""
         self.mode = mode
         self.ai = ai
+        self._print = output
         self.ascii_generator = ASCIIArtGenerator()
         self._check_dependencies()
     
@@ -97,7 +98,7 @@ class ArchitectureVisualizer:
                 error="AI assistance not available. Provide a built-in pattern or enable AI."
             )
             
-        print(f"🤖 AI is designing: {topic}...")
+        self._print(f"🤖 AI is designing: {topic}...")
         
         prompt = self._build_design_prompt(topic, output_format)
         response = self.ai.chat(prompt)
@@ -277,7 +278,7 @@ graph TB
             return DiagramResult(
                 success=False,
                 format=output_format,
-                error="diagrams library not installed. Run: pip install diagrams"
+                error="diagrams library not installed. Run: pip install 'clioraops[visualizer]'"
             )
         
         if not deps["graphviz"]:
@@ -5,9 +5,15 @@ Provides intelligent template-based responses when cloud AI providers are unavai
 """
 
 from enum import Enum
-from typing import Optional, Dict, List
+from functools import lru_cache
+from typing import Optional, Dict, List, Tuple
 import re
 
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
 
 class PromptCategory(Enum):
     """Categories of user prompts."""
@@ -20,6 +26,23 @@ class PromptCategory(Enum):
     GENERAL = "general"
 
 
+# Keyword triggers per category, checked in priority order
+CATEGORY_KEYWORDS = (
+    # Explain/Learn patterns
+    (PromptCategory.EXPLAIN, ("explain", "what is", "how does", "tell me about")),
+    # Debug patterns
+    (PromptCategory.DEBUG, ("debug", "error", "fix", "why is", "problem", "issue", "wrong")),
+    # Generate/Code patterns
+    (PromptCategory.GENERATE, ("generate", "create", "write", "build", "code", "script")),
+    # Design/Architecture patterns
+    (PromptCategory.DESIGN, ("design", "architect", "structure", "how should", "best practice")),
+    # Learn patterns
+    (PromptCategory.LEARN, ("learn", "tutorial", "guide", "steps", "how to")),
+    # Help patterns
+    (PromptCategory.HELP, ("help", "support", "assist", "guide me")),
+)
+
+
 class LocalKnowledgeBase:
     """
     Local knowledge base with template responses for common queries.
@@ -35,34 +58,20 @@ class LocalKnowledgeBase:
             "aws": self._aws_knowledge(),
             "devops": self._devops_knowledge(),
         }
+        self._hs_database = None
     
     def categorize_prompt(self, prompt: str) -> PromptCategory:
         """Categorize user prompt to determine response type."""
-        prompt_lower = prompt.lower().strip()
-        
-        # Explain/Learn patterns
-        if any(word in prompt_lower for word in ["explain", "what is", "how does", "tell me about"]):
-            return PromptCategory.EXPLAIN
-        
-        # Debug patterns
-        if any(word in prompt_lower for word in ["debug", "error", "fix", "why is", "problem", "issue", "wrong"]):
-            return PromptCategory.DEBUG
-        
-        # Generate/Code patterns
-        if any(word in prompt_lower for word in ["generate", "create", "write", "build", "code", "script"]):
-            return PromptCategory.GENERATE
-        
-        # Design/Architecture patterns
-        if any(word in prompt_lower for word in ["design", "architect", "structure", "how should", "best practice"]):
-            return PromptCategory.DESIGN
-        
-        # Learn patterns
-        if any(word in prompt_lower for word in ["learn", "tutorial", "guide", "steps", "how to"]):
-            return PromptCategory.LEARN
-        
-        # Help patterns
-        if any(word in prompt_lower for word in ["help", "support", "assist", "guide me"]):
-            return PromptCategory.HELP
+        return self._categorize_cached(prompt.lower().strip())
+    
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _categorize_cached(prompt_lower: str) -> PromptCategory:
+        """Keyword scan behind categorize_prompt, memoized on the normalized prompt."""
+        # First matching category wins, in CATEGORY_KEYWORDS order
+        for category, keywords in CATEGORY_KEYWORDS:
+            if any(word in prompt_lower for word in keywords):
+                return category
         
         return PromptCategory.GENERAL
     
@@ -104,6 +113,67 @@ class LocalKnowledgeBase:
         # Fall back to generic category response
         return self._get_category_response(prompt, category, system_prompt)
     
+    def classify_batch(self, prompts: List[str]) -> List[Tuple[PromptCategory, Optional[str]]]:
+        """
+        Categorize many prompts at once (e.g. replaying learning_log.md).
+        
+        Uses a single Hyperscan database matching every category and topic
+        keyword in one pass per prompt when python-hyperscan is installed,
+        otherwise falls back to categorize_prompt/extract_topic.
+        
+        Returns:
+            List of (category, topic) tuples in input order
+        """
+        if hyperscan is None:
+            return [(self.categorize_prompt(p), self.extract_topic(p)) for p in prompts]
+        
+        database, targets = self._batch_database()
+        results = []
+        
+        for prompt in prompts:
+            matched = set()
+            
+            def on_match(match_id, start, end, flags, context):
+                matched.add(match_id)
+            
+            database.scan(prompt.encode("utf-8"), match_event_handler=on_match)
+            
+            # Lowest id wins: categories and topics are numbered in priority order
+            category = PromptCategory.GENERAL
+            topic = None
+            for match_id in sorted(matched):
+                kind, value = targets[match_id]
+                if kind == "category" and category is PromptCategory.GENERAL:
+                    category = value
+                elif kind == "topic" and topic is None:
+                    topic = value
+            results.append((category, topic))
+        
+        return results
+    
+    def _batch_database(self):
+        """Compile (once) the Hyperscan database used by classify_batch."""
+        if self._hs_database is None:
+            expressions, targets = [], []
+            for category, keywords in CATEGORY_KEYWORDS:
+                for keyword in keywords:
+                    expressions.append(re.escape(keyword).encode("utf-8"))
+                    targets.append(("category", category))
+            for topic in self.knowledge:
+                expressions.append(re.escape(topic).encode("utf-8"))
+                targets.append(("topic", topic))
+            
+            # Each keyword gets its own id so priority follows list order
+            database = hyperscan.Database()
+            database.compile(
+                expressions=expressions,
+                ids=list(range(len(expressions))),
+                elements=len(expressions),
+                flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(expressions),
+            )
+            self._hs_database = (database, targets)
+        return self._hs_database
+    
     def _get_topic_response(
         self,
         topic: str,
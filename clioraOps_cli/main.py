@@ -2,27 +2,70 @@
 Main CLI entry point for ClioraOps.
 """
 
+import functools
+import os
+import sys
 import click
 from pathlib import Path
-from dotenv import load_dotenv
 from clioraOps_cli.config.settings import resolve_mode
-from clioraOps_cli.core.app import ClioraOpsApp
 from clioraOps_cli.version import __version__
 
-# Load environment variables from .env file if it exists
-# Try multiple locations
-env_paths = [
-    Path.cwd() / ".env",  # Current working directory
-    Path(__file__).parent.parent / ".env",  # Project root
-]
+# Arguments that are answered without running a command
+FAST_PATH_ARGS = {"--help", "-h", "--version"}
 
-for env_file in env_paths:
-    if env_file.exists():
-        load_dotenv(env_file)
-        break
+# Group options that consume the following argument
+OPTIONS_WITH_VALUES = {"--mode"}
 
 
-@click.group()
+def load_env():
+    """Load environment variables from the first .env file found."""
+    from dotenv import load_dotenv
+
+    env_paths = [
+        Path.cwd() / ".env",  # Current working directory
+        Path(__file__).parent.parent / ".env",  # Project root
+    ]
+
+    for env_file in env_paths:
+        if env_file.exists():
+            load_dotenv(env_file)
+            break
+
+
+def _sniff_subcommand(argv):
+    """
+    Return the subcommand argv will run, or None.
+
+    None means Click only has to print help or the version, or answer a
+    shell completion request, so no setup is needed.
+    """
+    if os.environ.get("_CLIORAOPS_COMPLETE") or FAST_PATH_ARGS.intersection(argv):
+        return None
+
+    args = iter(argv)
+    for arg in args:
+        if arg in OPTIONS_WITH_VALUES:
+            next(args, None)
+        elif not arg.startswith("-"):
+            return arg
+    return None
+
+
+def pass_app(f):
+    """
+    Like click.pass_obj, but passes a ClioraOpsApp built for the chosen mode.
+
+    The app (AI client, session, router) is imported and constructed only
+    when a command actually runs, so --help and --version stay fast.
+    """
+    @click.pass_context
+    def new_func(ctx, *args, **kwargs):
+        from clioraOps_cli.core.app import ClioraOpsApp
+        return ctx.invoke(f, ClioraOpsApp(ctx.obj), *args, **kwargs)
+    return functools.update_wrapper(new_func, f)
+
+
+@click.group(context_settings=dict(help_option_names=["-h", "--help"]))
 @click.option(
     "--mode",
     type=click.Choice(["beginner", "architect"]),
@@ -33,8 +76,8 @@ for env_file in env_paths:
 def cli(ctx, mode):
     """ClioraOps - DevOps Learning Companion"""
     
-    resolved_mode = resolve_mode(mode)
-    ctx.obj = ClioraOpsApp(resolved_mode)
+    # Commands receive the app through pass_app
+    ctx.obj = resolve_mode(mode)
 
 
 # -------------------------
@@ -42,7 +85,7 @@ def cli(ctx, mode):
 # -------------------------
 @cli.command()
 @click.argument("path", default=".")
-@click.pass_obj
+@pass_app
 def init(app, path):
     """Initialize project and scan for secrets."""
     app.run("init", path)
@@ -52,7 +95,7 @@ def init(app, path):
 # START SESSION
 # -------------------------
 @cli.command()
-@click.pass_obj
+@pass_app
 def start(app):
     """Start interactive session."""
     app.start()
@@ -63,7 +106,7 @@ def start(app):
 # -------------------------
 @cli.command()
 @click.argument("command", nargs=-1)
-@click.pass_obj
+@pass_app
 def review(app, command):
     """Review a command or script for safety."""
     app.run("review", *command)
@@ -74,7 +117,7 @@ def review(app, command):
 # -------------------------
 @cli.command()
 @click.argument("args", nargs=-1)
-@click.pass_obj
+@pass_app
 def generate(app, args):
     """Generate DevOps code/config."""
     app.run("generate", *args)
@@ -85,13 +128,15 @@ def generate(app, args):
 # -------------------------
 @cli.command(context_settings=dict(ignore_unknown_options=True, allow_extra_args=True))
 @click.argument("args", nargs=-1)
-@click.pass_obj
+@pass_app
 def design(app, args):
     """Design an architecture diagram."""
     app.run("design", *args)
 
 
 def main():
+    if _sniff_subcommand(sys.argv[1:]) is not None:
+        load_env()
     cli()
 
 
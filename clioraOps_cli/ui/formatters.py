@@ -1,16 +0,0 @@
-"""
-Output Formatters (Placeholder)
-
-This module is reserved for output formatting utilities and decorators.
-Currently, formatting is done inline in various modules.
-
-Potential features to add here:
-- Table formatters (ASCII tables, Markdown)
-- Color and style decorators
-- Output alignment utilities
-- Progress bar generators
-- Multi-column layout helpers
-
-To implement: Extract formatting code from other modules and consolidate here.
-See: ui/prompts.py for a working example of a focused UI module.
-"""
@@ -1,16 +0,0 @@
-"""
-File Operations Utilities (Placeholder)
-
-This module is reserved for common file operation utilities.
-Currently, file operations are handled inline in various modules.
-
-Potential features to add here:
-- Safe file reading with encoding detection
-- Recursive directory operations
-- Temporary file management
-- File permission utilities
-- Path normalization helpers
-
-To implement: Extract file operations from other modules and consolidate here.
-See: utils/logger.py for a working example of a focused utility module.
-"""
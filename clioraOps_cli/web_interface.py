@@ -1,33 +1,77 @@
-import gradio as gr
-import io
-import contextlib
+import asyncio
+import threading
+try:
+    import gradio as gr
+except ImportError as e:
+    raise ImportError(
+        "The web interface needs gradio. Run: pip install 'clioraops[gui]'"
+    ) from e
 from clioraOps_cli.core.app import ClioraOpsApp
+from clioraOps_cli.core.conversation_memory import ConversationMemory
 from clioraOps_cli.core.modes import Mode
+from clioraOps_cli.core.response_cache import ResponseCache
+
+# Prompts offered under the chat box
+EXAMPLE_PROMPTS = [
+    "try docker ps",
+    "design microservices",
+    "what is Kubernetes?",
+    "explain CI/CD",
+]
 
 class WebInterface:
+    __slots__ = ("_apps", "_apps_lock", "_cache", "_memory", "_interface")
+    
     def __init__(self):
-        self.app_beginner = ClioraOpsApp(Mode.BEGINNER)
-        self.app_architect = ClioraOpsApp(Mode.ARCHITECT)
+        # One app per mode, each built on first use. Requests never switch an
+        # app's mode, since other users' requests may be running on it.
+        self._apps = {}
+        self._apps_lock = threading.Lock()
+        # The apps share one cache so their writes to cache.db go through one lock
+        self._cache = ResponseCache()
+        self._memory = ConversationMemory()
+        self._interface = None
+    
+    def _get_app(self, mode: Mode) -> ClioraOpsApp:
+        """Return the shared app for mode, building it on first use."""
+        with self._apps_lock:
+            app = self._apps.get(mode)
+            if app is None:
+                app = ClioraOpsApp(mode, response_cache=self._cache)
+                # Build session and router now so concurrent requests don't each build one
+                app.session, app.command_router
+                self._apps[mode] = app
+            return app
     
-    def chat(self, message, mode, history):
-        """Handle chat message."""
-        app = self.app_beginner if mode == "Beginner" else self.app_architect
+    async def chat(self, message, mode, history):
+        """Handle chat message, streaming command output as it arrives."""
+        app = self._get_app(Mode.BEGINNER if mode == "Beginner" else Mode.ARCHITECT)
+        # The session keeps its conversation for the app's lifetime
+        conversation = app.session.conversation
         
-        # Capture stdout for commands
-        f = io.StringIO()
-        with contextlib.redirect_stdout(f):
-            # Check if it's a conversation or a command
-            if hasattr(app.session, 'conversation') and app.session.conversation.is_conversational_input(message):
-                response = app.session.conversation.handle_conversation(message)
-                if response:
-                    print(response)
-            else:
-                app.command_router.route(message)
+        # Summarizing and AI calls block, so run them off the event loop
+        history = await asyncio.to_thread(self._memory.compact, history, app.ai)
         
-        output = f.getvalue() or "No output."
+        # Check if it's a conversation or a command
+        if conversation is not None and conversation.is_conversational_input(message):
+            output = await asyncio.to_thread(conversation.handle_conversation, message)
+            yield "", history + [(message, output or "No output.")]
+            return
         
-        history.append((message, output))
-        return "", history
+        lines = []
+        async for line in app.stream(message):
+            lines.append(line)
+            yield "", history + [(message, "\n".join(lines))]
+        
+        if not "\n".join(lines):
+            yield "", history + [(message, "No output.")]
+    
+    @property
+    def interface(self):
+        """Gradio interface, built once and reused across launches."""
+        if self._interface is None:
+            self._interface = self.create_interface()
+        return self._interface
     
     def create_interface(self):
         """Create Gradio interface."""
@@ -54,12 +98,7 @@ class WebInterface:
             
             # Examples
             gr.Examples(
-                examples=[
-                    ["try docker ps"],
-                    ["design microservices"],
-                    ["what is Kubernetes?"],
-                    ["explain CI/CD"],
-                ],
+                examples=[[prompt] for prompt in EXAMPLE_PROMPTS],
                 inputs=msg
             )
             
@@ -76,12 +115,15 @@ class WebInterface:
                 outputs=[msg, chatbot]
             )
         
+        # Let concurrent users' requests run in parallel instead of one at a time
+        interface.queue(default_concurrency_limit=40)
+        
         return interface
     
     def launch(self, share=False):
         """Launch web interface."""
-        interface = self.create_interface()
-        interface.launch(
+        # Gradio relaunches a closed Blocks as is; any error here is real
+        self.interface.launch(
             server_name="0.0.0.0",
             server_port=7860,
             share=share  # Set True for public URL
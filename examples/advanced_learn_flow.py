@@ -6,10 +6,24 @@ Demonstrates:
 - Combining learn with explain for deeper understanding
 - Tracking learning progress
 - Beginner vs Architect mode differences
+
+Pass --non-interactive (or set CLIORAOPS_NONINTERACTIVE=1) to skip the
+"Press Enter" pauses, e.g. in CI or when timing the flow.
 """
 
+import os
+import sys
+
 from clioraOps_cli.core.app import ClioraOpsApp
-from clioraOps_cli.config.settings import resolve_mode
+from clioraOps_cli.core.modes import Mode
+
+INTERACTIVE = "--non-interactive" not in sys.argv and not os.environ.get("CLIORAOPS_NONINTERACTIVE")
+
+
+def pause(message):
+    """Wait for Enter, unless running non-interactively."""
+    if INTERACTIVE:
+        input(message)
 
 def run_learning_path():
     """Run a structured learning path through DevOps concepts."""
@@ -19,9 +33,8 @@ def run_learning_path():
     print("=" * 70)
     
     # Start in Beginner mode for foundational learning
-    mode = "beginner"
-    resolved_mode = resolve_mode(mode)
-    app = ClioraOpsApp(resolved_mode)
+    mode = Mode.BEGINNER
+    app = ClioraOpsApp(mode)
     
     learning_path = [
         ("ci_cd:intro", "CI/CD Fundamentals"),
@@ -29,7 +42,7 @@ def run_learning_path():
         ("orchestration:intro", "Container Orchestration"),
     ]
     
-    print(f"\n📚 Starting learning path in {mode} mode\n")
+    print(f"\n📚 Starting learning path in {mode.value} mode\n")
     
     for topic, title in learning_path:
         print(f"\n{'─' * 70}")
@@ -45,7 +58,7 @@ def run_learning_path():
         print(f"\n→ Getting expert explanation on {concept_name}...")
         app.run("explain", concept_name)
         
-        input("\n💡 Press Enter to continue to next topic...")
+        pause("\n💡 Press Enter to continue to next topic...")
     
     print("\n" + "=" * 70)
     print("✅ Learning path complete!")
@@ -54,15 +67,14 @@ def run_learning_path():
     # Now switch to architect mode for advanced concepts
     print("\n🏗️ Switching to Architect mode for advanced topics...\n")
     
-    architect_mode = "architect"
-    resolved_mode = resolve_mode(architect_mode)
-    app_architect = ClioraOpsApp(resolved_mode)
+    # Reuse the same app (and its session history) rather than building a new one
+    app.set_mode(Mode.ARCHITECT)
     
     print("→ Learning: Advanced CI/CD patterns")
-    app_architect.run("learn", "ci_cd:intro")
+    app.run("learn", "ci_cd:intro")
     
     print("\n→ Designing: Microservices architecture")
-    app_architect.run("design", "microservices")
+    app.run("design", "microservices")
 
 if __name__ == "__main__":
     run_learning_path()
@@ -12,19 +12,18 @@ Demonstrates:
 """
 
 from clioraOps_cli.core.app import ClioraOpsApp
-from clioraOps_cli.config.settings import resolve_mode
+from clioraOps_cli.core.modes import Mode
 from clioraOps_cli.utils.logger import log_learning_session  # Fixed import casing
 
 def run_demo():
     # -------------------------
     # 1️⃣ Start Session
     # -------------------------
-    mode = "beginner"  # change to "architect" to test advanced mode
-    resolved_mode = resolve_mode(mode)
+    mode = Mode.BEGINNER  # change to Mode.ARCHITECT to test advanced mode
 
-    print(f"🚀 Starting ClioraOps in {mode} mode...\n")
+    print(f"🚀 Starting ClioraOps in {mode.value} mode...\n")
 
-    app = ClioraOpsApp(resolved_mode)
+    app = ClioraOpsApp(mode)
     
     # NOTE: app.start() starts the interactive REPL. 
     # For this demo script, we want to run commands programmatically.
@@ -63,7 +62,7 @@ def run_demo():
     # In a real app, we might want to capture return values.
     log_learning_session(
         topic="ci_cd:intro",
-        mode=mode,
+        mode=mode.value,
         user_input="learn ci_cd:intro",
         copilot_output="(See CLI output)",
         visual_output="",
@@ -6,10 +6,24 @@ Demonstrates:
 - Generating pipeline configurations
 - Understanding pipeline components
 - Production deployment setup
+
+Pass --non-interactive (or set CLIORAOPS_NONINTERACTIVE=1) to skip the
+"Press Enter" pauses, e.g. in CI or when timing the flow.
 """
 
+import os
+import sys
+
 from clioraOps_cli.core.app import ClioraOpsApp
-from clioraOps_cli.config.settings import resolve_mode
+from clioraOps_cli.core.modes import Mode
+
+INTERACTIVE = "--non-interactive" not in sys.argv and not os.environ.get("CLIORAOPS_NONINTERACTIVE")
+
+
+def pause(message):
+    """Wait for Enter, unless running non-interactively."""
+    if INTERACTIVE:
+        input(message)
 
 def run_cicd_from_scratch():
     """Build a complete CI/CD pipeline from concept to implementation."""
@@ -18,11 +32,10 @@ def run_cicd_from_scratch():
     print("🚀 CI/CD FROM SCRATCH - Building Production Pipelines")
     print("=" * 70)
     
-    mode = "architect"  # Use architect mode for production patterns
-    resolved_mode = resolve_mode(mode)
-    app = ClioraOpsApp(resolved_mode)
+    mode = Mode.ARCHITECT  # Use architect mode for production patterns
+    app = ClioraOpsApp(mode)
     
-    print(f"\n🏗️ Starting in {mode} mode for enterprise-grade setup\n")
+    print(f"\n🏗️ Starting in {mode.value} mode for enterprise-grade setup\n")
     
     # Phase 1: Understanding CI/CD
     print("\n" + "=" * 70)
@@ -38,7 +51,7 @@ def run_cicd_from_scratch():
     print("\n→ Deep dive into Continuous Deployment...")
     app.run("explain", "Continuous Deployment strategies and best practices")
     
-    input("\n💡 Review the concepts above. Press Enter to continue...")
+    pause("\n💡 Review the concepts above. Press Enter to continue...")
     
     # Phase 2: Design the pipeline
     print("\n" + "=" * 70)
@@ -48,7 +61,7 @@ def run_cicd_from_scratch():
     print("→ Designing a CI/CD pipeline architecture...")
     app.run("design", "ci_cd_pipeline")
     
-    input("\n💡 Review the architecture. Press Enter to generate code...")
+    pause("\n💡 Review the architecture. Press Enter to generate code...")
     
     # Phase 3: Generate pipeline configurations
     print("\n" + "=" * 70)
@@ -61,16 +74,22 @@ def run_cicd_from_scratch():
         ("Kubernetes", "K8s manifests with CI/CD deployment automation"),
     ]
     
-    for pipeline_type, description in pipelines:
+    pipeline_commands = {
+        "GitHub Actions": "ci_pipeline",
+        "Docker": "dockerfile",
+        "Kubernetes": "kubernetes",
+    }
+    
+    # The three configs are independent, so generate them concurrently
+    outputs = app.run_batch([
+        ("generate", pipeline_commands[pipeline_type], description)
+        for pipeline_type, description in pipelines
+    ])
+    
+    for (pipeline_type, description), output in zip(pipelines, outputs):
         print(f"\n→ Generating {pipeline_type}...")
         print(f"   {description}")
-        
-        if "github" in pipeline_type.lower():
-            app.run("generate", "ci_pipeline", description)
-        elif "docker" in pipeline_type.lower():
-            app.run("generate", "dockerfile", description)
-        else:
-            app.run("generate", "kubernetes", description)
+        print(output)
     
     # Phase 4: Security and testing
     print("\n" + "=" * 70)
@@ -94,9 +113,11 @@ def run_cicd_from_scratch():
         "Rolling deployment zero downtime",
     ]
     
-    for strategy in strategies:
+    outputs = app.run_batch([("explain", strategy) for strategy in strategies])
+    
+    for strategy, output in zip(strategies, outputs):
         print(f"\n→ Learning about: {strategy}...")
-        app.run("explain", strategy)
+        print(output)
     
     # Phase 6: Debugging and troubleshooting
     print("\n" + "=" * 70)
@@ -109,9 +130,11 @@ def run_cicd_from_scratch():
         "container registry authentication error",
     ]
     
-    for error in error_scenarios:
+    outputs = app.run_batch([("debug", error) for error in error_scenarios])
+    
+    for error, output in zip(error_scenarios, outputs):
         print(f"\n→ Debugging: {error}...")
-        app.run("debug", error)
+        print(output)
     
     # Summary and next steps
     print("\n" + "=" * 70)
@@ -6,10 +6,24 @@ Demonstrates:
 - Combining design and generate commands
 - Creating production-ready templates
 - Learning from generated code
+
+Pass --non-interactive (or set CLIORAOPS_NONINTERACTIVE=1) to skip the
+"Press Enter" pauses, e.g. in CI or when timing the flow.
 """
 
+import os
+import sys
+
 from clioraOps_cli.core.app import ClioraOpsApp
-from clioraOps_cli.config.settings import resolve_mode
+from clioraOps_cli.core.modes import Mode
+
+INTERACTIVE = "--non-interactive" not in sys.argv and not os.environ.get("CLIORAOPS_NONINTERACTIVE")
+
+
+def pause(message):
+    """Wait for Enter, unless running non-interactively."""
+    if INTERACTIVE:
+        input(message)
 
 def run_code_generation_demo():
     """Demonstrate code generation and architecture design flow."""
@@ -18,11 +32,10 @@ def run_code_generation_demo():
     print("🔧 CODE GENERATION FLOW - From Design to Implementation")
     print("=" * 70)
     
-    mode = "architect"  # Use architect mode for production considerations
-    resolved_mode = resolve_mode(mode)
-    app = ClioraOpsApp(resolved_mode)
+    mode = Mode.ARCHITECT  # Use architect mode for production considerations
+    app = ClioraOpsApp(mode)
     
-    print(f"\n🚀 Starting in {mode} mode for production-ready generation\n")
+    print(f"\n🚀 Starting in {mode.value} mode for production-ready generation\n")
     
     # Step 1: Design the architecture
     print("\n" + "─" * 70)
@@ -32,7 +45,7 @@ def run_code_generation_demo():
     print("→ Visualizing microservices architecture...")
     app.run("design", "microservices")
     
-    input("\n💡 Review the architecture above. Press Enter to continue...")
+    pause("\n💡 Review the architecture above. Press Enter to continue...")
     
     # Step 2: Generate Dockerfile
     print("\n" + "─" * 70)
@@ -9,7 +9,8 @@ Demonstrates:
 """
 
 from clioraOps_cli.core.app import ClioraOpsApp
-from clioraOps_cli.config.settings import resolve_mode
+from clioraOps_cli.core.modes import Mode
+from clioraOps_cli.core.safety import is_obviously_dangerous
 
 def run_safety_review_demo():
     """Demonstrate safety-first approach to command execution."""
@@ -18,11 +19,10 @@ def run_safety_review_demo():
     print("🛡️  SAFETY REVIEW FLOW - Before You Execute")
     print("=" * 70)
     
-    mode = "beginner"  # Beginner mode provides extra safety warnings
-    resolved_mode = resolve_mode(mode)
-    app = ClioraOpsApp(resolved_mode)
+    mode = Mode.BEGINNER  # Beginner mode provides extra safety warnings
+    app = ClioraOpsApp(mode)
     
-    print(f"\n🔒 Starting in {mode} mode with enhanced safety checks\n")
+    print(f"\n🔒 Starting in {mode.value} mode with enhanced safety checks\n")
     
     # Test cases: mix of safe and dangerous commands
     test_commands = [
@@ -46,8 +46,16 @@ def run_safety_review_demo():
         print(f"   Command: {cmd}")
         print("─" * 70 + "\n")
         
+        # Obviously destructive commands don't need a full review round-trip
+        if is_obviously_dangerous(cmd):
+            dangerous_count += 1
+            print("⚠️  DANGEROUS - Not recommended without expert review")
+            print()
+            continue
+        
         # Check if command is safe
-        result = app.run("try", cmd)
+        result = app.command_router.route(f"try {cmd}", return_output=True)
+        print(result)
         
         # In real scenario, result would indicate safety
         if "dangerous" in result.lower() or "risky" in result.lower():
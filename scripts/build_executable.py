@@ -1,3 +1,4 @@
+import importlib.util
 import os
 import subprocess
 import sys
@@ -5,18 +6,17 @@ import sys
 def build():
     print("💎 Building ClioraOps Standalone Executable...")
     
-    try:
-        import PyInstaller
-    except ImportError:
+    # find_spec only probes the path; importing PyInstaller takes a while
+    if importlib.util.find_spec("PyInstaller") is None:
         print("❌ PyInstaller not found. Installing...")
         subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
+        importlib.invalidate_caches()
 
     # Path to the entry point
     entry_point = "clioraOps_cli/main.py"
     
-    # Build command
-    cmd = [
-        "pyinstaller",
+    # Build arguments
+    args = [
         "--onefile",
         "--name", "clioraops",
         "--collect-all", "clioraOps_cli",
@@ -24,8 +24,18 @@ def build():
         entry_point
     ]
     
-    print(f"🏃 Running: {' '.join(cmd)}")
-    subprocess.check_call(cmd)
+    print(f"🏃 Running: pyinstaller {' '.join(args)}")
+    
+    try:
+        # Build in-process; a fresh pyinstaller process re-imports everything
+        from PyInstaller.__main__ import run as pyinstaller_run
+    except ImportError:
+        pyinstaller_run = None
+    
+    if pyinstaller_run is not None:
+        pyinstaller_run(args)
+    else:
+        subprocess.check_call(["pyinstaller", *args])
     
     print("\n✅ Build Complete!")
     print(f"📂 Executable location: dist/clioraops")
@@ -6,23 +6,32 @@ Usage:
     python scripts/bump_version.py major|minor|patch
 """
 
+import os
 import sys
 import re
 from pathlib import Path
 from datetime import datetime
 
-def get_current_version():
-    """Extract current version from setup.py"""
-    setup_path = Path(__file__).parent.parent / "setup.py"
-    with open(setup_path) as f:
-        content = f.read()
-    match = re.search(r'version="([^"]*)"', content)
+VERSION_PATH = Path(__file__).parent.parent / "clioraOps_cli" / "version.py"
+CHANGELOG_PATH = Path(__file__).parent.parent / "CHANGELOG.md"
+
+VERSION_RE = re.compile(r'__version__ = "([^"]*)"')
+RELEASE_HEADER_RE = re.compile(r'^## \[', re.MULTILINE)
+
+def write_atomic(path, content):
+    """Write content to path via a temp file so a crash never leaves it half-written"""
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(content)
+    os.replace(tmp, path)
+
+def get_current_version(content):
+    """Extract current version from version.py contents"""
+    match = VERSION_RE.search(content)
     return match.group(1) if match else "0.1.0"
 
 def bump_version(current, bump_type):
     """Bump semantic version"""
-    parts = current.split('.')
-    major, minor, patch = int(parts[0]), int(parts[1]), int(parts[2])
+    major, minor, patch = map(int, current.split('.', 2))
     
     if bump_type == 'major':
         major += 1
@@ -36,44 +45,29 @@ def bump_version(current, bump_type):
     
     return f"{major}.{minor}.{patch}"
 
-def update_setup_py(version):
-    """Update version in setup.py"""
-    setup_path = Path(__file__).parent.parent / "setup.py"
-    with open(setup_path) as f:
-        content = f.read()
-    
-    content = re.sub(r'version="[^"]*"', f'version="{version}"', content)
+def update_version_file(content, version):
+    """Update __version__ in clioraOps_cli/version.py (setup.py reads it from there)"""
+    content = VERSION_RE.sub(f'__version__ = "{version}"', content, count=1)
+    write_atomic(VERSION_PATH, content)
     
-    with open(setup_path, 'w') as f:
-        f.write(content)
-    
-    print(f"✓ Updated setup.py to version {version}")
+    print(f"✓ Updated clioraOps_cli/version.py to version {version}")
 
 def update_changelog(version):
     """Add entry to CHANGELOG.md"""
-    changelog_path = Path(__file__).parent.parent / "CHANGELOG.md"
     today = datetime.now().strftime("%Y-%m-%d")
     
     entry = f"## [{version}] - {today}\n\n### Changes\n- Placeholder for release notes\n\n"
     
-    with open(changelog_path) as f:
-        content = f.read()
-    
-    # Insert after the "# Changelog" header and description
-    lines = content.split('\n')
-    insert_idx = 0
-    for i, line in enumerate(lines):
-        if line.startswith('## ['):
-            insert_idx = i
-            break
-    
-    if insert_idx == 0:
-        insert_idx = 3
-    
-    new_content = '\n'.join(lines[:insert_idx]) + '\n\n' + entry + '\n'.join(lines[insert_idx:])
+    content = CHANGELOG_PATH.read_text()
     
-    with open(changelog_path, 'w') as f:
-        f.write(new_content)
+    # Insert before the first release header, or after the "# Changelog"
+    # header and description when there are no releases yet
+    match = RELEASE_HEADER_RE.search(content)
+    if match:
+        new_content = content[:match.start()] + entry + content[match.start():]
+    else:
+        new_content = content.rstrip('\n') + '\n\n' + entry
+    write_atomic(CHANGELOG_PATH, new_content)
     
     print(f"✓ Added CHANGELOG.md entry for version {version}")
 
@@ -82,17 +76,18 @@ if __name__ == "__main__":
         print("Usage: python scripts/bump_version.py major|minor|patch")
         sys.exit(1)
     
-    current = get_current_version()
+    version_content = VERSION_PATH.read_text()
+    current = get_current_version(version_content)
     bump_type = sys.argv[1]
     new_version = bump_version(current, bump_type)
     
     print(f"Bumping version: {current} → {new_version} ({bump_type})")
     
-    update_setup_py(new_version)
+    update_version_file(version_content, new_version)
     update_changelog(new_version)
     
     print(f"\n✓ Version bump complete! Next steps:")
     print(f"  1. Review changes and update CHANGELOG.md with details")
-    print(f"  2. Commit: git add setup.py CHANGELOG.md && git commit -m 'chore: bump to {new_version}'")
+    print(f"  2. Commit: git add clioraOps_cli/version.py CHANGELOG.md && git commit -m 'chore: bump to {new_version}'")
     print(f"  3. Tag: git tag -a v{new_version} -m 'Release {new_version}'")
     print(f"  4. Push: git push origin main --follow-tags")
@@ -5,7 +5,9 @@ Usage: python scripts/setup_ai.py
 """
 
 import os
+import shutil
 import sys
+import tempfile
 from pathlib import Path
 
 
@@ -113,10 +115,7 @@ def save_env_file(config):
     env_path = Path.cwd() / ".env"
     
     # Read existing .env if present
-    existing_content = ""
-    if env_path.exists():
-        with open(env_path, "r") as f:
-            existing_content = f.read()
+    existing_content = env_path.read_text() if env_path.exists() else ""
     
     # Prepare new content
     lines = []
@@ -127,9 +126,19 @@ def save_env_file(config):
     if "api_key" in config:
         lines.append(f"{config['key_name']}={config['api_key']}\n")
     
-    # Write to .env
-    with open(env_path, "a" if existing_content else "w") as f:
-        f.writelines(lines)
+    # Write to .env through a temp file so an interrupted save can't truncate it.
+    # mkstemp creates it unpredictably named and owner-only (0600); an existing
+    # .env's permissions are carried over before it is replaced.
+    fd, tmp_name = tempfile.mkstemp(dir=env_path.parent, prefix=".env.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(existing_content + "".join(lines))
+        if env_path.exists():
+            shutil.copymode(env_path, tmp_name)
+        os.replace(tmp_name, env_path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
     
     return str(env_path)
 
@@ -0,0 +1,116 @@
+"""
+Shared fixtures for the ClioraOps test suite.
+"""
+
+import json
+import types
+from pathlib import Path
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from clioraOps_cli.core.commands import CommandRouter
+from clioraOps_cli.core.response_cache import ResponseCache
+from clioraOps_cli.core.session import SessionManager
+from clioraOps_cli.integrations.ai_provider import AIClient
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--runslow", action="store_true", default=False, help="run tests marked slow"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip @pytest.mark.slow tests unless --runslow is given."""
+    if config.getoption("--runslow"):
+        return
+
+    skip_slow = pytest.mark.skip(reason="needs --runslow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+# Canned AI replies, keyed by name
+AI_RESPONSES_PATH = Path(__file__).parent / "fixtures" / "ai_responses.json"
+
+
+@pytest.fixture(scope="session")
+def ai_responses():
+    """The canned AI replies as JSON strings, read and serialized once per session."""
+    payloads = json.loads(AI_RESPONSES_PATH.read_text())
+    return {name: json.dumps(payload) for name, payload in payloads.items()}
+
+
+class StubAI:
+    """
+    Minimal stand-in for AIClient.
+
+    chat() returns whatever set_response() was given and records its
+    arguments in last_call. Plain slots instead of a Mock, so attribute
+    access costs nothing and a misspelled attribute raises.
+    """
+
+    __slots__ = ("is_available", "_response", "last_call")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.is_available = True
+        self._response = None
+        self.last_call = None
+
+    def set_response(self, response):
+        self._response = response
+
+    def chat(self, prompt, **kwargs):
+        self.last_call = {"prompt": prompt, **kwargs}
+        return self._response
+
+
+@pytest.fixture(scope="module")
+def module_stub_ai():
+    """One StubAI per test module, for module-scoped fixtures that need a client."""
+    return StubAI()
+
+
+@pytest.fixture
+def stub_ai(module_stub_ai):
+    """The module's StubAI, reset before each test."""
+    module_stub_ai.reset()
+    return module_stub_ai
+
+
+@pytest.fixture
+def app_mocks(tmp_path):
+    """
+    Patch the collaborators ClioraOpsApp builds with fresh mocks.
+
+    Exposes the instances the app ends up with (ai, session, router) and
+    the patched factories (create_ai_client, SessionManager, CommandRouter).
+    The response cache lives in tmp_path.
+
+    Instances are specced against the real classes so a misspelled
+    attribute fails the test. The AI client gets spec rather than spec_set
+    because the app assigns its instance-level `mode`.
+    """
+    mocks = types.SimpleNamespace(
+        ai=Mock(spec=AIClient),
+        session=Mock(spec_set=SessionManager),
+        router=Mock(spec_set=CommandRouter),
+    )
+    mocks.create_ai_client = MagicMock(return_value=mocks.ai)
+    mocks.SessionManager = MagicMock(return_value=mocks.session)
+    mocks.CommandRouter = MagicMock(return_value=mocks.router)
+
+    # One target lookup for all four names
+    with patch.multiple(
+        "clioraOps_cli.core.app",
+        create_ai_client=mocks.create_ai_client,
+        SessionManager=mocks.SessionManager,
+        CommandRouter=mocks.CommandRouter,
+        ResponseCache=lambda: ResponseCache(config_dir=tmp_path),
+    ):
+        yield mocks
@@ -1,178 +1,278 @@
+import asyncio
+import subprocess
+import sys
+
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 from clioraOps_cli.core.app import ClioraOpsApp
 from clioraOps_cli.core.modes import Mode
+from clioraOps_cli.core.response_cache import ResponseCache
+
+# Every test gets patched collaborators; tests that inspect them request the fixture by name
+pytestmark = pytest.mark.usefixtures("app_mocks")
 
 
 class TestClioraOpsAppInitialization:
     """Test ClioraOpsApp initialization."""
 
-    @patch("clioraOps_cli.core.app.create_ai_client")
-    @patch("clioraOps_cli.core.app.SessionManager")
-    @patch("clioraOps_cli.core.app.CommandRouter")
-    def test_app_init_beginner_mode(self, mock_router, mock_session, mock_create_ai):
-        mock_ai_instance = MagicMock()
-        mock_create_ai.return_value = mock_ai_instance
+    @pytest.mark.parametrize("mode", list(Mode))
+    def test_app_init(self, app_mocks, mode):
+        app = ClioraOpsApp(mode)
 
-        app = ClioraOpsApp(Mode.BEGINNER)
-
-        assert app.mode == Mode.BEGINNER
+        assert app.mode == mode
         assert app.ai is not None
-        mock_create_ai.assert_called_once_with(mode=Mode.BEGINNER)
+        app_mocks.create_ai_client.assert_called_once_with(mode=mode)
 
-    @patch("clioraOps_cli.core.app.create_ai_client")
-    @patch("clioraOps_cli.core.app.SessionManager")
-    @patch("clioraOps_cli.core.app.CommandRouter")
-    def test_app_init_architect_mode(self, mock_router, mock_session, mock_create_ai):
-        mock_ai_instance = MagicMock()
-        mock_create_ai.return_value = mock_ai_instance
 
-        app = ClioraOpsApp(Mode.ARCHITECT)
+class TestClioraOpsAppLazyInit:
+    """Test that AI client, session and router are built on first use."""
 
-        assert app.mode == Mode.ARCHITECT
-        assert app.ai is not None
-        mock_create_ai.assert_called_once_with(mode=Mode.ARCHITECT)
+    def test_init_builds_nothing(self, app_mocks):
+        ClioraOpsApp(Mode.BEGINNER)
+
+        app_mocks.create_ai_client.assert_not_called()
+        app_mocks.SessionManager.assert_not_called()
+        app_mocks.CommandRouter.assert_not_called()
+
+    def test_run_does_not_build_session(self, app_mocks):
+        app = ClioraOpsApp(Mode.BEGINNER)
+        app.run("try", "ls")
+
+        app_mocks.SessionManager.assert_not_called()
+        assert app_mocks.CommandRouter.call_args.args[1] is app.context
+
+    @patch("clioraOps_cli.core.app.save_config")
+    def test_mode_switch_before_first_use(self, mock_save, app_mocks):
+        app = ClioraOpsApp(Mode.BEGINNER)
+        app.update_mode(Mode.ARCHITECT)
+        app.run("help")
+
+        app_mocks.create_ai_client.assert_called_once_with(mode=Mode.ARCHITECT)
+        assert app_mocks.CommandRouter.call_args.args[0] == Mode.ARCHITECT
 
 
 class TestClioraOpsAppModeUpdate:
     """Test mode switching."""
 
-    @patch("clioraOps_cli.core.app.create_ai_client")
-    @patch("clioraOps_cli.core.app.SessionManager")
-    @patch("clioraOps_cli.core.app.CommandRouter")
-    def test_update_mode_beginner_to_architect(self, mock_router, mock_session, mock_create_ai):
-        mock_create_ai.return_value = MagicMock()
+    @pytest.mark.parametrize("start,end", [
+        (Mode.BEGINNER, Mode.ARCHITECT),
+        (Mode.ARCHITECT, Mode.BEGINNER),
+    ])
+    @patch("clioraOps_cli.core.app.save_config")
+    def test_update_mode(self, mock_save, app_mocks, start, end):
+        app = ClioraOpsApp(start)
+        app.session, app.command_router  # build the lazily created parts
 
-        mock_session_instance = MagicMock()
-        mock_session.return_value = mock_session_instance
+        app.update_mode(end)
 
-        mock_router_instance = MagicMock()
-        mock_router.return_value = mock_router_instance
+        assert app.mode == end
+        app_mocks.session.update_mode.assert_called_with(end)
+        app_mocks.router.update_mode.assert_called_with(end)
+        mock_save.assert_called_once_with(end)
 
+    @patch("clioraOps_cli.core.app.save_config")
+    def test_set_mode_does_not_persist(self, mock_save, app_mocks):
         app = ClioraOpsApp(Mode.BEGINNER)
-        assert app.mode == Mode.BEGINNER
-
-        app.update_mode(Mode.ARCHITECT)
+        app.session, app.command_router  # build the lazily created parts
+        app.set_mode(Mode.ARCHITECT)
 
         assert app.mode == Mode.ARCHITECT
-        mock_session_instance.update_mode.assert_called_with(Mode.ARCHITECT)
-        mock_router_instance.update_mode.assert_called_with(Mode.ARCHITECT)
+        assert app_mocks.ai.mode == Mode.ARCHITECT
+        app_mocks.session.update_mode.assert_called_with(Mode.ARCHITECT)
+        mock_save.assert_not_called()
 
-    @patch("clioraOps_cli.core.app.create_ai_client")
-    @patch("clioraOps_cli.core.app.SessionManager")
-    @patch("clioraOps_cli.core.app.CommandRouter")
-    def test_update_mode_architect_to_beginner(self, mock_router, mock_session, mock_create_ai):
-        mock_create_ai.return_value = MagicMock()
 
-        mock_session_instance = MagicMock()
-        mock_session.return_value = mock_session_instance
+class TestClioraOpsAppCommandExecution:
+    """Test command execution."""
 
-        mock_router_instance = MagicMock()
-        mock_router.return_value = mock_router_instance
+    @pytest.mark.parametrize("mode", list(Mode))
+    @pytest.mark.parametrize("args,joined", [
+        (("try", "docker ps"), "try docker ps"),
+        (("generate", "dockerfile", "python", "fastapi"), "generate dockerfile python fastapi"),
+        (("help",), "help"),
+    ])
+    def test_run_dispatches(self, app_mocks, mode, args, joined):
+        app = ClioraOpsApp(mode)
+        app.run(*args)
 
-        app = ClioraOpsApp(Mode.ARCHITECT)
-        assert app.mode == Mode.ARCHITECT
+        app_mocks.router.route.assert_called_once_with(joined)
 
-        app.update_mode(Mode.BEGINNER)
 
-        assert app.mode == Mode.BEGINNER
-        mock_session_instance.update_mode.assert_called_with(Mode.BEGINNER)
-        mock_router_instance.update_mode.assert_called_with(Mode.BEGINNER)
+class TestClioraOpsAppComponents:
+    """Test app components."""
 
+    @pytest.mark.parametrize("mode", list(Mode))
+    def test_app_has_session_manager(self, app_mocks, mode):
+        app = ClioraOpsApp(mode)
 
-class TestClioraOpsAppCommandExecution:
-    """Test command execution."""
+        assert app.session is not None
+        app_mocks.SessionManager.assert_called_once()
 
-    @patch("clioraOps_cli.core.app.create_ai_client")
-    @patch("clioraOps_cli.core.app.SessionManager")
-    @patch("clioraOps_cli.core.app.CommandRouter")
-    def test_run_single_command(self, mock_router, mock_session, mock_create_ai):
-        mock_create_ai.return_value = MagicMock()
+    @pytest.mark.parametrize("mode", list(Mode))
+    def test_app_has_command_router(self, app_mocks, mode):
+        app = ClioraOpsApp(mode)
 
-        mock_router_instance = MagicMock()
-        mock_router.return_value = mock_router_instance
+        assert app.command_router is not None
+        app_mocks.CommandRouter.assert_called_once()
 
+    def test_app_has_no_instance_dict(self):
         app = ClioraOpsApp(Mode.BEGINNER)
-        app.run("try", "docker ps")
 
-        mock_router_instance.route.assert_called_once_with("try docker ps")
+        assert not hasattr(app, "__dict__")
+        with pytest.raises(AttributeError):
+            app.not_a_slot = None
 
-    @patch("clioraOps_cli.core.app.create_ai_client")
-    @patch("clioraOps_cli.core.app.SessionManager")
-    @patch("clioraOps_cli.core.app.CommandRouter")
-    def test_run_command_with_multiple_args(self, mock_router, mock_session, mock_create_ai):
-        mock_create_ai.return_value = MagicMock()
 
-        mock_router_instance = MagicMock()
-        mock_router.return_value = mock_router_instance
+class TestClioraOpsAppModePreservation:
+    """Test that mode is preserved across operations."""
 
-        app = ClioraOpsApp(Mode.BEGINNER)
-        app.run("generate", "dockerfile", "python", "fastapi")
+    @pytest.mark.parametrize("mode", list(Mode))
+    def test_mode_preserved_after_command(self, mode):
+        app = ClioraOpsApp(mode)
 
-        mock_router_instance.route.assert_called_once_with(
-            "generate dockerfile python fastapi"
-        )
+        app.run("try", "ls")
+
+        assert app.mode == mode
 
-    @patch("clioraOps_cli.core.app.create_ai_client")
-    @patch("clioraOps_cli.core.app.SessionManager")
-    @patch("clioraOps_cli.core.app.CommandRouter")
-    def test_run_no_args(self, mock_router, mock_session, mock_create_ai):
-        mock_create_ai.return_value = MagicMock()
 
-        mock_router_instance = MagicMock()
-        mock_router.return_value = mock_router_instance
+class TestClioraOpsAppResponseCache:
+    """Test caching of AI-backed commands."""
+
+    def test_repeated_learn_routes_once(self, app_mocks):
+        app_mocks.router.route_for_cache.return_value = ("📚 Learning: ci_cd:intro", True)
 
         app = ClioraOpsApp(Mode.BEGINNER)
-        app.run("help")
+        app.run("learn", "ci_cd:intro")
+        app.run("learn", "ci_cd:intro")
 
-        mock_router_instance.route.assert_called_once_with("help")
+        app_mocks.router.route_for_cache.assert_called_once_with("learn ci_cd:intro")
 
+    def test_key_ignores_how_args_are_split(self, app_mocks):
+        app_mocks.router.route_for_cache.return_value = ("📚 Learning: docker ps", True)
 
-class TestClioraOpsAppComponents:
-    """Test app components."""
+        app = ClioraOpsApp(Mode.BEGINNER)
+        app.run("learn", "docker ps")
+        app.run("learn", "docker", "ps")
 
-    @patch("clioraOps_cli.core.app.create_ai_client")
-    @patch("clioraOps_cli.core.app.SessionManager")
-    @patch("clioraOps_cli.core.app.CommandRouter")
-    def test_app_has_session_manager(self, mock_router, mock_session, mock_create_ai):
-        mock_create_ai.return_value = MagicMock()
-        mock_session_instance = MagicMock()
-        mock_session.return_value = mock_session_instance
+        app_mocks.router.route_for_cache.assert_called_once_with("learn docker ps")
+
+    def test_cached_output_returned(self, app_mocks):
+        app_mocks.router.route_for_cache.return_value = ("🏗️ Design: microservices", True)
 
         app = ClioraOpsApp(Mode.BEGINNER)
+        first = app._run_cached("design", ("microservices",))
+        second = app._run_cached("design", ("microservices",))
 
-        assert app.session is not None
-        mock_session.assert_called_once()
+        assert first == second == "🏗️ Design: microservices"
+        app_mocks.router.route_for_cache.assert_called_once_with("design microservices")
 
-    @patch("clioraOps_cli.core.app.create_ai_client")
-    @patch("clioraOps_cli.core.app.SessionManager")
-    @patch("clioraOps_cli.core.app.CommandRouter")
-    def test_app_has_command_router(self, mock_router, mock_session, mock_create_ai):
-        mock_create_ai.return_value = MagicMock()
-        mock_router_instance = MagicMock()
-        mock_router.return_value = mock_router_instance
+    def test_failed_output_not_cached(self, app_mocks):
+        app_mocks.router.route_for_cache.return_value = ("❌ Error: quota exceeded", False)
 
         app = ClioraOpsApp(Mode.BEGINNER)
+        app._run_cached("explain", ("docker",))
+        output = app._run_cached("explain", ("docker",))
 
-        assert app.command_router is not None
-        mock_router.assert_called_once()
+        assert output == "❌ Error: quota exceeded"
+        assert app_mocks.router.route_for_cache.call_count == 2
 
+    def test_cache_hit_updates_context(self, app_mocks):
+        app_mocks.router.route_for_cache.return_value = ("📚 Learning: docker", True)
+        ClioraOpsApp(Mode.BEGINNER)._run_cached("learn", ("docker",))
+
+        # A fresh app sharing the same cache file
+        app = ClioraOpsApp(Mode.BEGINNER)
+        app._run_cached("learn", ("docker",))
+
+        assert app.context.current_topic == "docker"
+        app_mocks.router.route_for_cache.assert_called_once()
+
+    def test_apps_share_given_cache(self, app_mocks, tmp_path):
+        app_mocks.router.route_for_cache.return_value = ("📚 Learning: docker", True)
+        cache = ResponseCache(config_dir=tmp_path)
+
+        ClioraOpsApp(Mode.BEGINNER, response_cache=cache).run("learn", "docker")
+        app = ClioraOpsApp(Mode.BEGINNER, response_cache=cache)
+        app.run("learn", "docker")
+
+        assert app.response_cache is cache
+        app_mocks.router.route_for_cache.assert_called_once()
+
+    def test_cache_lookup_does_not_probe_ai(self, app_mocks):
+        app_mocks.router.route_for_cache.return_value = ("📖 CI/CD", True)
+
+        app = ClioraOpsApp(Mode.BEGINNER)
+        app._run_cached("explain", ("ci_cd",))
+        app._run_cached("explain", ("ci_cd",))
+
+        app_mocks.ai.is_available.assert_not_called()
 
-class TestClioraOpsAppModePreservation:
-    """Test that mode is preserved across operations."""
 
-    @patch("clioraOps_cli.core.app.create_ai_client")
-    @patch("clioraOps_cli.core.app.SessionManager")
-    @patch("clioraOps_cli.core.app.CommandRouter")
-    def test_mode_preserved_after_command(self, mock_router, mock_session, mock_create_ai):
-        mock_create_ai.return_value = MagicMock()
+class TestClioraOpsAppBatch:
+    """Test concurrent batch execution."""
 
-        mock_router_instance = MagicMock()
-        mock_router.return_value = mock_router_instance
+    def test_run_batch_preserves_order(self, app_mocks):
+        app_mocks.router.route.side_effect = lambda line, return_output=False: f"out: {line}"
 
         app = ClioraOpsApp(Mode.ARCHITECT)
-        original_mode = app.mode
+        outputs = app.run_batch([
+            ("generate", "dockerfile", "python"),
+            ("debug", "timeout"),
+            ("try", "ls"),
+        ])
 
-        app.run("try", "ls")
+        assert outputs == [
+            "out: generate dockerfile python",
+            "out: debug timeout",
+            "out: try ls",
+        ]
+
+
+class TestClioraOpsAppStream:
+    """Test progressive command output."""
+
+    @staticmethod
+    def _collect(app, line):
+        async def consume():
+            return [chunk async for chunk in app.stream(line)]
+        return asyncio.run(consume())
+
+    def test_stream_yields_lines_in_order(self, app_mocks):
+        def route_for_cache(line, on_output=None):
+            for chunk in ("🐳 Trying: docker ps", "✅ Safe"):
+                on_output(chunk)
+            return "🐳 Trying: docker ps\n✅ Safe", True
+
+        app_mocks.router.route_for_cache.side_effect = route_for_cache
+
+        app = ClioraOpsApp(Mode.BEGINNER)
+
+        assert self._collect(app, "try docker ps") == ["🐳 Trying: docker ps", "✅ Safe"]
+
+    def test_stream_caches_ai_output(self, app_mocks):
+        def route_for_cache(line, on_output=None):
+            on_output("📖 CI/CD")
+            return "📖 CI/CD", True
+
+        app_mocks.router.route_for_cache.side_effect = route_for_cache
+
+        app = ClioraOpsApp(Mode.BEGINNER)
+        self._collect(app, "explain ci_cd")
+
+        assert self._collect(app, "explain ci_cd") == ["📖 CI/CD"]
+        assert app_mocks.router.route_for_cache.call_count == 1
+
+
+class TestClioraOpsAppImports:
+    """Test that importing the app stays free of heavy optional SDKs."""
+
+    @pytest.mark.parametrize("module", ["clioraOps_cli.main", "clioraOps_cli.core.app"])
+    def test_no_optional_sdk_imports(self, module):
+        # A fresh interpreter, since this test session may have imported anything
+        code = (
+            f"import sys, {module}; "
+            "print(','.join(m for m in ('google.generativeai', 'gradio', 'diagrams') if m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
 
-        assert app.mode == original_mode
+        assert result.stdout.strip() == ""
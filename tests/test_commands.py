@@ -0,0 +1,134 @@
+"""
+Unit tests for command routing output.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from clioraOps_cli.core.commands import CommandRouter
+from clioraOps_cli.core.context import SessionContext
+from clioraOps_cli.core.modes import Mode
+from clioraOps_cli.features.boilerplate import BoilerplateManager
+from clioraOps_cli.features.visualizer import ArchitectureVisualizer
+from clioraOps_cli.integrations.ai_provider import AIClient, AIProviderType, AIResponse
+
+
+@pytest.fixture
+def make_router(tmp_path, monkeypatch, capsys):
+    """
+    Build a real CommandRouter with its policy file under tmp_path.
+
+    With an ai_response, the AI counts as available and explain() returns it;
+    without one, AI is off.
+    """
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+
+    def make(ai_response=None):
+        ai = Mock(spec=AIClient)
+        ai.is_available = ai_response is not None
+        ai.explain.return_value = ai_response
+        router = CommandRouter(Mode.BEGINNER, SessionContext(), ai)
+
+        capsys.readouterr()  # drop the startup notice
+        return router
+
+    return make
+
+
+@pytest.fixture
+def router(make_router):
+    """A real CommandRouter with AI off."""
+    return make_router()
+
+
+class TestRouteOutput:
+    """Test route(return_output=True) buffering."""
+
+    def test_prints_without_return_output(self, router, capsys):
+        assert router.route("help") is None
+        assert "🚀 ClioraOps Commands:" in capsys.readouterr().out
+
+    def test_return_output_collects_instead_of_printing(self, router, capsys):
+        output = router.route("help", return_output=True)
+
+        assert "🚀 ClioraOps Commands:" in output
+        assert capsys.readouterr().out == ""
+
+    def test_on_output_gets_each_line(self, router):
+        lines = []
+        output = router.route("help", return_output=True, on_output=lines.append)
+
+        assert lines
+        assert "\n".join(lines) == output
+
+    def test_buffer_reset_after_route(self, router, capsys):
+        router.route("help", return_output=True)
+        router.route("help")
+
+        assert "🚀 ClioraOps Commands:" in capsys.readouterr().out
+
+    def test_init_progress_is_captured(self, router, tmp_path, capsys):
+        output = router.route(f"init {tmp_path}", return_output=True)
+
+        assert "🚀 Initializing ClioraOps in" in output
+        assert "📝 Generating clioraOps-instructions.md..." in output
+        assert capsys.readouterr().out == ""
+
+
+class TestRouteForCache:
+    """Test that only successful AI-backed output is reported as cacheable."""
+
+    def test_static_output_cacheable(self, router):
+        output, cacheable = router.route_for_cache("design microservices")
+
+        assert output
+        assert cacheable
+
+    def test_ai_off_not_cacheable(self, router):
+        output, cacheable = router.route_for_cache("learn docker")
+
+        assert "DISABLED" in output
+        assert not cacheable
+
+    @pytest.mark.parametrize("response,expected", [
+        (AIResponse(success=True, content="Docker is...", provider=AIProviderType.GEMINI), True),
+        (AIResponse(success=True, content="(Local Fallback) ...", provider=AIProviderType.LOCAL), False),
+        (AIResponse(success=False, content="", provider=AIProviderType.GEMINI, error="quota"), False),
+    ])
+    def test_ai_answer(self, make_router, response, expected):
+        router = make_router(response)
+
+        for line in ("learn docker", "explain docker"):
+            _, cacheable = router.route_for_cache(line)
+            assert cacheable is expected
+
+    def test_flag_resets_between_routes(self, make_router):
+        router = make_router(AIResponse(success=True, content="ok", provider=AIProviderType.GEMINI))
+        router.route_for_cache("design not-a-pattern")
+
+        assert router.route_for_cache("learn docker")[1]
+
+
+class TestFeatureOutput:
+    """Test that features send status lines to the output they were given."""
+
+    def test_boilerplate_error(self, capsys):
+        lines = []
+        manager = BoilerplateManager(Mode.BEGINNER, output=lines.append)
+
+        assert manager.generate("no-such-template") is False
+        assert lines == ["❌ Template not found: no-such-template"]
+        assert capsys.readouterr().out == ""
+
+    def test_visualizer_progress(self, stub_ai, capsys):
+        stub_ai.set_response(AIResponse(success=False, content="boom", provider=AIProviderType.LOCAL))
+        lines = []
+        visualizer = ArchitectureVisualizer(Mode.ARCHITECT, ai=stub_ai, output=lines.append)
+
+        result = visualizer.generate_custom("event mesh")
+
+        assert not result.success
+        assert lines == ["🤖 AI is designing: event mesh..."]
+        assert capsys.readouterr().out == ""
@@ -0,0 +1,39 @@
+"""
+Unit tests for conversational input detection.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from clioraOps_cli.core.conversation import ConversationManager
+from clioraOps_cli.core.modes import Mode
+
+
+@pytest.fixture
+def manager():
+    return ConversationManager(Mode.BEGINNER, MagicMock(), MagicMock())
+
+
+class TestIsConversationalInput:
+    """Test the conversation vs command split."""
+
+    @pytest.mark.parametrize("message", [
+        "what is Kubernetes",
+        "Explain CI/CD",
+        "  tell me about pods",
+        "yes",
+        "OK",
+        "docker ps?",
+    ])
+    def test_conversational(self, manager, message):
+        assert manager.is_conversational_input(message)
+
+    @pytest.mark.parametrize("message", [
+        "try docker ps",
+        "design microservices",
+        "learn ci_cd:intro",
+        "generate dockerfile python",
+    ])
+    def test_commands(self, manager, message):
+        assert not manager.is_conversational_input(message)
@@ -0,0 +1,52 @@
+"""
+Unit tests for bounded web chat history.
+"""
+
+from unittest.mock import MagicMock
+
+from clioraOps_cli.core.conversation_memory import ConversationMemory, SYNOPSIS_PREFIX
+from clioraOps_cli.integrations.ai_provider import AIResponse, AIProviderType
+
+
+def _history(n):
+    return [(f"question {i}", f"answer {i}") for i in range(n)]
+
+
+class TestConversationMemory:
+    """Test history compaction."""
+
+    def test_short_history_unchanged(self):
+        memory = ConversationMemory(max_recent_turns=10)
+        history = _history(10)
+        assert memory.compact(history) is history
+
+    def test_long_history_keeps_recent_turns(self):
+        memory = ConversationMemory(max_recent_turns=10)
+        compacted = memory.compact(_history(12))
+
+        assert len(compacted) == 6
+        assert compacted[0][0] is None
+        assert compacted[0][1].startswith(SYNOPSIS_PREFIX)
+        assert compacted[1:] == _history(12)[-5:]
+
+    def test_uses_ai_summary(self):
+        ai = MagicMock()
+        ai.chat.return_value = AIResponse(
+            success=True, content="Discussed Docker basics.", provider=AIProviderType.GEMINI
+        )
+        memory = ConversationMemory(max_recent_turns=4)
+        compacted = memory.compact(_history(6), ai)
+
+        assert compacted[0][1] == SYNOPSIS_PREFIX + "Discussed Docker basics."
+        assert "question 0" in ai.chat.call_args[0][0]
+
+    def test_local_fallback_uses_excerpt(self):
+        ai = MagicMock()
+        ai.chat.return_value = AIResponse(
+            success=True, content="Got your question!", provider=AIProviderType.LOCAL
+        )
+        memory = ConversationMemory(max_recent_turns=4)
+        compacted = memory.compact(_history(6), ai)
+
+        assert "User: question 0" in compacted[0][1]
+        assert "Got your question!" not in compacted[0][1]
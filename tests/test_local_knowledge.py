@@ -0,0 +1,55 @@
+"""
+Unit tests for the local knowledge base.
+"""
+
+import pytest
+
+from clioraOps_cli.integrations import local_knowledge
+from clioraOps_cli.integrations.local_knowledge import LocalKnowledgeBase, PromptCategory
+
+
+# Several hit more than one category or topic, so priority matters
+PROMPTS = [
+    "Explain Docker",
+    "why is my docker build failing with an error?",
+    "how to fix a Kubernetes CrashLoopBackOff issue",
+    "DESIGN a ci_cd pipeline on AWS",
+    "help me write a terraform script for aws",
+    "what is devops and how should I learn it",
+    "build a docker image for kubernetes",
+    "tutorial: guide me through terraform",
+    "hello there 🐳 — Überblick über DOCKER?",
+    "",
+]
+
+
+@pytest.fixture(scope="module")
+def kb():
+    return LocalKnowledgeBase()
+
+
+def _one_by_one(kb, prompts):
+    return [(kb.categorize_prompt(p), kb.extract_topic(p)) for p in prompts]
+
+
+class TestClassifyBatch:
+    """Test that batch classification agrees with the single-prompt path."""
+
+    def test_fallback_matches_single_prompt_path(self, kb, monkeypatch):
+        monkeypatch.setattr(local_knowledge, "hyperscan", None)
+
+        assert kb.classify_batch(PROMPTS) == _one_by_one(kb, PROMPTS)
+
+    def test_hyperscan_matches_single_prompt_path(self, kb):
+        pytest.importorskip("hyperscan")
+
+        assert kb.classify_batch(PROMPTS) == _one_by_one(kb, PROMPTS)
+
+    def test_priority(self, kb):
+        # "explain" outranks "error"; "docker" is listed before "kubernetes"
+        assert kb.classify_batch(["explain this docker error in kubernetes"]) == [
+            (PromptCategory.EXPLAIN, "docker")
+        ]
+
+    def test_empty_batch(self, kb):
+        assert kb.classify_batch([]) == []
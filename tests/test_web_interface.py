@@ -0,0 +1,72 @@
+"""
+Unit tests for the web chat handler.
+"""
+
+import asyncio
+import types
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("gradio")
+
+from clioraOps_cli.core.modes import Mode
+from clioraOps_cli.web_interface import WebInterface
+
+
+class FakeApp:
+    """Stand-in for ClioraOpsApp whose streamed output names its mode."""
+
+    def __init__(self, mode, response_cache=None):
+        self.mode = mode
+        self.response_cache = response_cache
+        self.ai = None
+        self.session = types.SimpleNamespace(conversation=None)
+        self.command_router = None
+
+    async def stream(self, user_input):
+        # Hand control back so the other request runs in between
+        await asyncio.sleep(0)
+        yield f"{self.mode.value}: {user_input}"
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def web():
+    with patch("clioraOps_cli.web_interface.ClioraOpsApp", FakeApp):
+        yield WebInterface()
+
+
+class TestWebInterfaceModes:
+    """Test that concurrent requests in different modes don't share an app."""
+
+    @staticmethod
+    async def _reply(web, message, mode):
+        updates = [history async for _, history in web.chat(message, mode, [])]
+        return updates[-1][-1][1]
+
+    def test_concurrent_modes(self, web):
+        async def both():
+            return await asyncio.gather(
+                self._reply(web, "learn docker", "Beginner"),
+                self._reply(web, "learn docker", "Architect"),
+            )
+
+        beginner, architect = asyncio.run(both())
+
+        assert beginner == "beginner: learn docker"
+        assert architect == "architect: learn docker"
+
+    def test_one_app_per_mode(self, web):
+        beginner = web._get_app(Mode.BEGINNER)
+
+        assert web._get_app(Mode.BEGINNER) is beginner
+        assert web._get_app(Mode.ARCHITECT) is not beginner
+        assert beginner.mode == Mode.BEGINNER
+
+    def test_apps_share_cache(self, web):
+        beginner = web._get_app(Mode.BEGINNER)
+        architect = web._get_app(Mode.ARCHITECT)
+
+        assert beginner.response_cache is not None
+        assert beginner.response_cache is architect.response_cache